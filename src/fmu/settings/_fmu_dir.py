@@ -1,5 +1,8 @@
 """Main interface for working with .fmu directory."""
 
+import contextlib
+import os
+import stat
 from collections.abc import Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, Self, TypeAlias, cast
@@ -26,6 +29,51 @@ logger: Final = null_logger(__name__)
 
 FMUConfigManager: TypeAlias = ProjectConfigManager | UserConfigManager
 
+_FILE_PATH_CACHE_SIZE: Final = 64
+
+
+def _read_all(path: Path) -> bytes:
+    """Read a whole file without going through a buffered reader.
+
+    Whole-file reads gain nothing from Python's read buffer, so the file is opened
+    unbuffered and read in one go, sized from fstat().
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.readall()
+
+
+def _write_all(path: Path, data: bytes) -> None:
+    """Replace a whole file so that it is never visible half-written.
+
+    The data is written to a uniquely named temporary file next to the target and
+    moved into place with os.replace(), so another process reading the .fmu
+    directory sees either the old or the new contents. Symlinks are followed, and
+    an existing file keeps its permissions, but the rename gives it a new inode, so
+    hard links to the old file keep the old contents. The payload is already
+    complete in memory, so it is handed to the OS directly instead of being copied
+    through Python's write buffer.
+    """
+    path = path.resolve()
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    temp_path = Path(f"{path}.tmp.{os.urandom(4).hex()}")
+    try:
+        with open(temp_path, "wb", buffering=0) as f:
+            view = memoryview(data)
+            while view:
+                written = f.write(view)
+                view = view[written:]
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
 
 class FMUDirectoryBase:
     """Provides access to a .fmu directory and operations on its contents."""
@@ -55,21 +103,27 @@ class FMUDirectoryBase:
             FileNotFoundError: If .fmu directory doesn't exist
             PermissionError: If lacking permissions to read/write to the directory
         """
+        # Keep base_path canonical: resolve_path_inside_project() and comparisons
+        # between directories opened through symlinks rely on it
         self.base_path = Path(base_path).resolve()
         logger.debug(f"Initializing FMUDirectory from '{base_path}'")
-        self._lock = LockManager(self, timeout_seconds=lock_timeout_seconds)
-        self._cache_manager = CacheManager(self, max_revisions=cache_revisions)
+        self._file_paths: dict[str | Path, Path] = {}
 
         fmu_dir = self.base_path / ".fmu"
-        if path_exists(fmu_dir):
-            if path_is_dir(fmu_dir):
-                self._path = fmu_dir
-            else:
-                raise FileExistsError(
-                    f".fmu exists at {self.base_path} but is not a directory"
-                )
-        else:
-            raise FileNotFoundError(f"No .fmu directory found at {self.base_path}")
+        # One stat tells a missing .fmu apart from one that is not a directory
+        try:
+            fmu_dir_mode = fmu_dir.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileNotFoundError(
+                f"No .fmu directory found at {self.base_path}"
+            ) from e
+        if not stat.S_ISDIR(fmu_dir_mode):
+            raise FileExistsError(
+                f".fmu exists at {self.base_path} but is not a directory"
+            )
+        self._path = fmu_dir
+        self._lock = LockManager(self, timeout_seconds=lock_timeout_seconds)
+        self._cache_manager = CacheManager(self, max_revisions=cache_revisions)
 
         logger.debug(f"Using .fmu directory at {self._path}")
 
@@ -163,7 +217,14 @@ class FMUDirectoryBase:
         Returns:
             Absolute path to the file
         """
-        return self.path / relative_path
+        # Resource managers ask for the same few paths on every access
+        file_path = self._file_paths.get(relative_path)
+        if file_path is None:
+            if len(self._file_paths) >= _FILE_PATH_CACHE_SIZE:
+                self._file_paths.clear()
+            file_path = self.path / relative_path
+            self._file_paths[relative_path] = file_path
+        return file_path
 
     def read_file(self, relative_path: str | Path) -> bytes:
         """Reads a file from the .fmu directory.
@@ -177,8 +238,7 @@ class FMUDirectoryBase:
         Raises:
             FileNotFoundError: If the file doesn't exist
         """
-        file_path = self.get_file_path(relative_path)
-        return file_path.read_bytes()
+        return _read_all(self.get_file_path(relative_path))
 
     def read_text_file(self, relative_path: str | Path, encoding: str = "utf-8") -> str:
         """Reads a text file from the .fmu directory.
@@ -190,25 +250,42 @@ class FMUDirectoryBase:
         Returns:
             File contents as string
         """
-        file_path = self.get_file_path(relative_path)
-        return file_path.read_text(encoding=encoding)
-
-    def write_file(self, relative_path: str | Path, data: bytes) -> None:
+        text = _read_all(self.get_file_path(relative_path)).decode(encoding)
+        if "\r" in text:
+            # Keep the universal newline handling of text mode reads
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def write_file(
+        self,
+        relative_path: str | Path,
+        data: bytes,
+        *,
+        create_parents: bool = True,
+    ) -> None:
         """Writes bytes to a file in the .fmu directory.
 
         Args:
             relative_path: Path relative to the .fmu directory
             data: Bytes to write
+            create_parents: Create missing parent directories. Callers that already
+                ensured the parent directory can pass False. Default True
         """
         self._lock.ensure_can_write()
         file_path = self.get_file_path(relative_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if create_parents:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_path.write_bytes(data)
+        _write_all(file_path, data)
         logger.debug(f"Wrote {len(data)} bytes to {file_path}")
 
     def write_text_file(
-        self, relative_path: str | Path, content: str, encoding: str = "utf-8"
+        self,
+        relative_path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+        *,
+        create_parents: bool = True,
     ) -> None:
         """Writes text to a file in the .fmu directory.
 
@@ -216,12 +293,15 @@ class FMUDirectoryBase:
             relative_path: Path relative to the .fmu directory
             content: Text content to write
             encoding: Text encoding to use. Default utf-8
+            create_parents: Create missing parent directories. Callers that already
+                ensured the parent directory can pass False. Default True
         """
         self._lock.ensure_can_write()
         file_path = self.get_file_path(relative_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if create_parents:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_path.write_text(content, encoding=encoding)
+        _write_all(file_path, content.encode(encoding))
         logger.debug(f"Wrote text file to {file_path}")
 
     def list_files(self, subdirectory: str | Path | None = None) -> list[Path]:
@@ -234,11 +314,12 @@ class FMUDirectoryBase:
             List of Path objects for files (not directories)
         """
         base = self.get_file_path(subdirectory) if subdirectory else self.path
-        if not path_exists(base):
+        try:
+            with os.scandir(base) as entries:
+                return [base / entry.name for entry in entries if entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        return [p for p in base.iterdir() if path_is_file(p)]
-
     def ensure_directory(self, relative_path: str | Path) -> Path:
         """Ensures a subdirectory exists in the .fmu directory.
 
@@ -286,7 +367,7 @@ class FMUDirectoryBase:
 
         readme_path = self.get_file_path("README")
         if self._README_CONTENT and not path_exists(readme_path):
-            self.write_text_file("README", self._README_CONTENT)
+            self.write_text_file("README", self._README_CONTENT, create_parents=False)
             logger.info(f"Restored README at {readme_path}")
 
         config_path = self.config.path
@@ -322,12 +403,12 @@ class ProjectFMUDirectory(FMUDirectoryBase):
             base_path: Project directory containing the .fmu folder.
             lock_timeout_seconds: Lock expiration time in seconds. Default 20 minutes.
         """
-        self.config = ProjectConfigManager(self)
         super().__init__(
             base_path,
             CacheManager.MIN_REVISIONS,
             lock_timeout_seconds=lock_timeout_seconds,
         )
+        self.config = ProjectConfigManager(self)
         self._changelog = ChangelogManager(self)
         self._mappings = MappingsManager(self)
         try:
@@ -553,24 +634,17 @@ class ProjectFMUDirectory(FMUDirectoryBase):
         Returns:
             Path to the found .fmu directory or None if not found
         """
-        current = start_path
-        # Prevent symlink loops
-        visited = set()
-
-        while current not in visited:
-            visited.add(current)
-            fmu_dir = current / ".fmu"
-
+        home = Path.home()
+        # Path.parents is lexical and always ends at the root (or '.' for relative
+        # paths), so walking it cannot loop even if the tree contains symlink loops
+        for current in (start_path, *start_path.parents):
             # Do not include $HOME/.fmu in the search
-            if path_is_dir(fmu_dir) and current != Path.home():
+            if current == home:
+                continue
+            fmu_dir = current / ".fmu"
+            if path_is_dir(fmu_dir):
                 return fmu_dir
 
-            # We hit root
-            if current == current.parent:
-                break
-
-            current = current.parent
-
         return None
 
     @classmethod
@@ -745,12 +819,12 @@ class UserFMUDirectory(FMUDirectoryBase):
         Args:
             lock_timeout_seconds: Lock expiration time in seconds. Default 20 minutes.
         """
-        self.config = UserConfigManager(self)
         super().__init__(
             Path.home(),
             CacheManager.MIN_REVISIONS,
             lock_timeout_seconds=lock_timeout_seconds,
         )
+        self.config = UserConfigManager(self)
         try:
             max_revisions = self.config.get(
                 "cache_max_revisions", CacheManager.MIN_REVISIONS
@@ -135,7 +135,7 @@ def init_fmu_directory(
         base_path,
         lock_timeout_seconds=lock_timeout_seconds,
     )
-    fmu_dir.write_text_file("README", PROJECT_README_CONTENT)
+    fmu_dir.write_text_file("README", PROJECT_README_CONTENT, create_parents=False)
 
     fmu_dir.config.reset()
     fmu_dir.changelog.log_init_to_changelog()
@@ -176,7 +176,7 @@ def init_user_fmu_directory(
     _create_fmu_directory(Path.home())
 
     fmu_dir = UserFMUDirectory(lock_timeout_seconds=lock_timeout_seconds)
-    fmu_dir.write_text_file("README", USER_README_CONTENT)
+    fmu_dir.write_text_file("README", USER_README_CONTENT, create_parents=False)
 
     fmu_dir.config.reset()
     logger.debug(f"Successfully initialized .fmu directory at '{fmu_dir}'")
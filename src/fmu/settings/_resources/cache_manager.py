@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
+import errno
+import os
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Final, Self, TypeVar
-from uuid import uuid4
 
 from pydantic import BaseModel, ValidationError
 
 from fmu.settings._logging import null_logger
-from fmu.settings._utils import path_is_dir, path_is_file
 
 if TYPE_CHECKING:
     from fmu.settings._fmu_dir import FMUDirectoryBase
@@ -25,6 +26,17 @@ _CACHEDIR_TAG_CONTENT: Final = (
     "# For information about cache directory tags, see:\n"
     "#	https://bford.info/cachedir/spec.html"
 )
+_CACHEDIR_TAG_BYTES: Final = _CACHEDIR_TAG_CONTENT.encode("utf-8")
+
+# Linux only; creates an unnamed file that is given its name once fully written
+_O_TMPFILE: Final[int | None] = getattr(os, "O_TMPFILE", None)
+
+
+def _write_fd(fd: int, data: bytes) -> None:
+    """Write all of data to an open file descriptor."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
 
 
 class CacheManager:
@@ -48,6 +60,7 @@ class CacheManager:
         self._fmu_dir = fmu_dir
         self._cache_root = Path("cache")
         self._max_revisions = max(self.MIN_REVISIONS, max_revisions)
+        self._cachedir_tag_ensured = False
 
     @property
     def max_revisions(self: Self) -> int:
@@ -88,10 +101,8 @@ class CacheManager:
         snapshot_name = self._snapshot_filename(resource_file_path)
         snapshot_path = cache_dir / snapshot_name
 
-        cache_relative = self._cache_root / resource_file_path.stem
-        self._fmu_dir.write_text_file(
-            cache_relative / snapshot_name, content, encoding=encoding
-        )
+        self._fmu_dir._lock.ensure_can_write()
+        self._write_snapshot(snapshot_path, content.encode(encoding))
         logger.debug(f"Stored revision snapshot at {snapshot_path}")
 
         if not skip_trim:
@@ -110,24 +121,28 @@ class CacheManager:
         """
         resource_file_path = Path(resource_file_path)
         cache_relative = self._cache_root / resource_file_path.stem
-        if not self._fmu_dir.file_exists(cache_relative):
-            return []
         cache_dir = self._fmu_dir.get_file_path(cache_relative)
 
-        revisions = [p for p in cache_dir.iterdir() if path_is_file(p)]
-        revisions.sort(key=lambda path: path.name)
-        return revisions
+        try:
+            names = self._revision_names(cache_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        return [cache_dir / name for name in names]
 
     def trim_all_revisions(self: Self) -> None:
         """Trim all cached resources to the configured revision limit."""
-        if not self._fmu_dir.file_exists(self._cache_root):
+        cache_root = self._fmu_dir.get_file_path(self._cache_root)
+        try:
+            with os.scandir(cache_root) as entries:
+                resource_cache_dirs = [
+                    entry.path for entry in entries if entry.is_dir()
+                ]
+        except FileNotFoundError:
             return
 
-        cache_root = self._fmu_dir.get_file_path(self._cache_root)
-        for resource_cache_dir in cache_root.iterdir():
-            if not path_is_dir(resource_cache_dir):
-                continue
-            self._trim(resource_cache_dir)
+        for resource_cache_dir in resource_cache_dirs:
+            self._trim(Path(resource_cache_dir))
 
     def get_revision_content(
         self: Self,
@@ -218,46 +233,134 @@ class CacheManager:
 
         logger.info(f"Restored {resource_file_path} from cache revision {revision_id}")
 
+    def _revision_names(self: Self, cache_dir: Path) -> list[str]:
+        """Return the sorted snapshot filenames in a resource cache directory.
+
+        The directory is scanned on every call, since other processes sharing the
+        .fmu directory may add or remove snapshots at any time.
+
+        Raises:
+            FileNotFoundError: If the cache directory does not exist.
+            NotADirectoryError: If the cache directory is not a directory.
+        """
+        with os.scandir(cache_dir) as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+        names.sort()
+        return names
+
     def _ensure_resource_cache_dir(self: Self, resource_file_path: Path) -> Path:
         """Create (if needed) and return the cache directory for resource file."""
-        self._cache_root_path(create=True)
-        resource_cache_dir_relative = self._cache_root / resource_file_path.stem
-        return self._fmu_dir.ensure_directory(resource_cache_dir_relative)
+        cache_dir = self._cache_root_path(create=True) / resource_file_path.stem
+        cache_dir.mkdir(exist_ok=True)
+        return cache_dir
 
     def _cache_root_path(self: Self, create: bool) -> Path:
         """Resolve the cache root, creating it and the cachedir tag if requested."""
+        cache_root = self._fmu_dir.get_file_path(self._cache_root)
         if create:
-            cache_root = self._fmu_dir.ensure_directory(self._cache_root)
+            try:
+                cache_root.mkdir(parents=True)
+            except FileExistsError:
+                pass
+            else:
+                # A new cache root, e.g. after the cache was deleted, has no tag yet
+                self._cachedir_tag_ensured = False
             self._ensure_cachedir_tag()
-            return cache_root
 
-        return self._fmu_dir.get_file_path(self._cache_root)
+        return cache_root
 
     def _ensure_cachedir_tag(self: Self) -> None:
         """Ensure the cache root complies with the Cachedir specification."""
+        if self._cachedir_tag_ensured:
+            return
         tag_path_relative = self._cache_root / "CACHEDIR.TAG"
-        if self._fmu_dir.file_exists(tag_path_relative):
+        if not self._fmu_dir.file_exists(tag_path_relative):
+            self._fmu_dir.write_file(
+                tag_path_relative, _CACHEDIR_TAG_BYTES, create_parents=False
+            )
+        self._cachedir_tag_ensured = True
+
+    def _write_snapshot(self: Self, snapshot_path: Path, data: bytes) -> None:
+        """Create a snapshot file so that it is never visible half-written.
+
+        On Linux the data is written to an unnamed O_TMPFILE in the cache directory
+        and then linked into place. Elsewhere, or if the filesystem or a missing
+        /proc prevents it, the data is written to a temporary file in the cache root
+        and moved into place with os.replace().
+        """
+        if self._link_tmpfile(snapshot_path, data):
             return
-        self._fmu_dir.write_text_file(tag_path_relative, _CACHEDIR_TAG_CONTENT)
+
+        temp_path = self._cache_root_path(create=False) / f".{snapshot_path.name}.tmp"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                _write_fd(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(temp_path, snapshot_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _link_tmpfile(snapshot_path: Path, data: bytes) -> bool:
+        """Write data to an O_TMPFILE and link it at snapshot_path.
+
+        Returns:
+            False if O_TMPFILE or linking it through /proc is unavailable here.
+        """
+        if _O_TMPFILE is None:
+            return False
+        try:
+            fd = os.open(
+                snapshot_path.parent, _O_TMPFILE | os.O_WRONLY | os.O_CLOEXEC, 0o666
+            )
+        except (IsADirectoryError, NotADirectoryError):
+            # Kernels or filesystems without O_TMPFILE support
+            return False
+        except OSError as e:
+            if e.errno in (errno.EOPNOTSUPP, errno.EINVAL):
+                return False
+            raise
+
+        try:
+            _write_fd(fd, data)
+            try:
+                # Passing a dir fd makes os.link() use linkat() with
+                # AT_SYMLINK_FOLLOW, which links the file the /proc entry points
+                # to. The fd itself is ignored since the source path is absolute.
+                os.link(f"/proc/self/fd/{fd}", snapshot_path, src_dir_fd=fd)
+            except OSError:
+                # E.g. /proc is not mounted; the unnamed file is freed on close
+                return False
+        finally:
+            os.close(fd)
+        return True
 
     def _snapshot_filename(self: Self, resource_file_path: Path) -> str:
         """Generate a timestamped filename for the next snapshot."""
-        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S.%fZ")
+        # Same layout as strftime("%Y%m%dT%H%M%S.%fZ"), which is slower
+        now = datetime.now(UTC)
+        timestamp = (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}T"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}.{now.microsecond:06d}Z"
+        )
         suffix = resource_file_path.suffix or ".txt"
-        token = uuid4().hex[:8]
+        token = os.urandom(4).hex()
         return f"{timestamp}-{token}{suffix}"
 
     def _trim(self: Self, cache_dir: Path) -> None:
         """Remove the oldest snapshots until the retention limit is respected."""
-        revisions = [p for p in cache_dir.iterdir() if path_is_file(p)]
-        if len(revisions) <= self.max_revisions:
+        revision_names = self._revision_names(cache_dir)
+        if len(revision_names) <= self.max_revisions:
             return
 
-        revisions.sort(key=lambda path: path.name)
-        excess = len(revisions) - self.max_revisions
-        for old_revision in revisions[:excess]:
+        excess = len(revision_names) - self.max_revisions
+        for old_name in revision_names[:excess]:
             try:
-                old_revision.unlink()
+                os.unlink(os.path.join(cache_dir, old_name))
             except FileNotFoundError:
                 continue
 
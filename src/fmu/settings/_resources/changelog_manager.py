@@ -42,6 +42,7 @@ class ChangelogManager(LogManager[ChangeInfo]):
     ) -> None:
         """Logs the update of a resource to the changelog."""
         _MISSING_KEY = object()
+        change_entries: list[ChangeInfo] = []
         for key, new_value in updates.items():
             change_type = ChangeType.update
             if "." in key:
@@ -85,7 +86,9 @@ class ChangelogManager(LogManager[ChangeInfo]):
                 file=str(relative_path),
                 key=key,
             )
-            self.add_log_entry(change_entry)
+            change_entries.append(change_entry)
+
+        self.add_log_entries(change_entries)
 
     def log_merge_to_changelog(
         self: Self, source_path: Path, incoming_path: Path, merged_resources: list[str]
@@ -198,6 +201,5 @@ class ChangelogManager(LogManager[ChangeInfo]):
 
         All log entries in the change object are added to the changelog.
         """
-        for entry in change:
-            self.add_log_entry(entry)
+        self.add_log_entries(change)
         return self.load()
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import copy
-import getpass
 from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Final, Self
 
 from fmu.settings._logging import null_logger
+from fmu.settings._utils import current_user
 from fmu.settings.models.project_config import ProjectConfig
 from fmu.settings.models.user_config import UserConfig
 
@@ -27,6 +27,20 @@ if TYPE_CHECKING:
 
 logger: Final = null_logger(__name__)
 
+_PROJECT_CONFIG_DIFF_IGNORE_FIELDS: Final = frozenset(
+    {"created_at", "created_by", "last_modified_at", "last_modified_by"}
+)
+_PROJECT_CONFIG_DIFF_LIST_KEYS: Final = MappingProxyType(
+    {
+        "rms.zones": "name",
+        "rms.horizons": "name",
+        "rms.wells": "name",
+        "masterdata.smda.country": "uuid",
+        "masterdata.smda.discovery": "uuid",
+        "masterdata.smda.field": "uuid",
+    }
+)
+
 
 class ProjectConfigManager(MutablePydanticResourceManager[ProjectConfig]):
     """Manages the .fmu configuration file in a project."""
@@ -43,50 +57,43 @@ class ProjectConfigManager(MutablePydanticResourceManager[ProjectConfig]):
         return Path("config.json")
 
     @property
-    def diff_ignore_fields(self: Self) -> list[str]:
-        """Returns a list of all config fields that should be ignored in a diff."""
-        return ["created_at", "created_by", "last_modified_at", "last_modified_by"]
+    def diff_ignore_fields(self: Self) -> frozenset[str]:
+        """Returns the config fields that should be ignored in a diff."""
+        return _PROJECT_CONFIG_DIFF_IGNORE_FIELDS
 
     @property
     def diff_list_keys(self: Self) -> Mapping[str, str]:
         """List field identity keys used for per-item diffing."""
-        return {
-            "rms.zones": "name",
-            "rms.horizons": "name",
-            "rms.wells": "name",
-            "masterdata.smda.country": "uuid",
-            "masterdata.smda.discovery": "uuid",
-            "masterdata.smda.field": "uuid",
-        }
+        return _PROJECT_CONFIG_DIFF_LIST_KEYS
 
     def save(self: Self, model: ProjectConfig) -> None:
         """Save the ProjectConfig to disk, updating last_modified fields."""
         model_dict = model.model_dump()
         model_dict["last_modified_at"] = datetime.now(UTC)
-        model_dict["last_modified_by"] = getpass.getuser()
+        model_dict["last_modified_by"] = current_user()
         updated_model = ProjectConfig.model_validate(model_dict)
         super().save(updated_model)
 
     def set(self: Self, key: str, value: Any) -> None:
         """Sets a project config value by key and writes to changelog."""
-        old_resource_dict = copy.deepcopy(self.load().model_dump())
-        super().set(key, value)
-        self.fmu_dir.changelog.log_update_to_changelog(
-            updates={key: value},
-            old_resource_dict=old_resource_dict,
-            relative_path=self.relative_path,
-        )
+        old_resource_dict = self.load().model_dump()
+        if self._set(key, value):
+            self.fmu_dir.changelog.log_update_to_changelog(
+                updates={key: value},
+                old_resource_dict=old_resource_dict,
+                relative_path=self.relative_path,
+            )
 
     def update(self: Self, updates: dict[str, Any]) -> ProjectConfig:
         """Updates project config values and writes to changelog."""
-        old_resource_dict = copy.deepcopy(self.load().model_dump())
-        updated_resource = super().update(updates)
-        self.fmu_dir.changelog.log_update_to_changelog(
-            updates=updates,
-            old_resource_dict=old_resource_dict,
-            relative_path=self.relative_path,
-        )
-        return updated_resource
+        old_resource_dict = self.load().model_dump()
+        if self._update(updates):
+            self.fmu_dir.changelog.log_update_to_changelog(
+                updates=updates,
+                old_resource_dict=old_resource_dict,
+                relative_path=self.relative_path,
+            )
+        return self.load()
 
 
 class UserConfigManager(MutablePydanticResourceManager[UserConfig]):
@@ -182,15 +182,25 @@ class LockManager(PydanticResourceManager[LockInfo]):
             self.release()
             return False
 
-        return self._is_mine(current_lock) and not self._is_stale()
+        return self._holds(current_lock)
+
+    def _holds(self: Self, current_lock: LockInfo) -> bool:
+        """Returns whether the lock read from disk is acquired by this instance."""
+        return (
+            self._cache is not None
+            and self._acquired_at is not None
+            and self._is_mine(current_lock)
+            and not self._is_stale()
+        )
 
     def ensure_can_write(self: Self) -> None:
         """Raise PermissionError if another process currently holds the lock."""
+        # Read the lock once and check ownership on that same read, as this runs
+        # before every write
         lock_info = self.safe_load(force=True, store_cache=False)
         if (
-            self.exists
-            and lock_info is not None
-            and not self.is_acquired()
+            lock_info is not None
+            and not self._holds(lock_info)
             and not self._is_stale(lock_info=lock_info)
         ):
             raise PermissionError(
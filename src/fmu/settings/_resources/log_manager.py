@@ -3,7 +3,6 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Generic, Self, get_args, get_origin
 
-import pandas as pd
 from pydantic import AwareDatetime, ValidationError
 
 from fmu.settings._resources.pydantic_resource_manager import PydanticResourceManager
@@ -11,6 +10,10 @@ from fmu.settings.models._enums import FilterType
 from fmu.settings.models.log import Filter, Log, LogEntryType
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pandas as pd
+
     # Avoid circular dependency for type hint in __init__ only
     from fmu.settings._fmu_dir import (
         FMUDirectoryBase,
@@ -31,23 +34,44 @@ class LogManager(PydanticResourceManager[Log[LogEntryType]], Generic[LogEntryTyp
 
     def add_log_entry(self: Self, log_entry: LogEntryType) -> None:
         """Adds a log entry to the log resource."""
-        try:
-            validated_entry = log_entry.model_validate(log_entry.model_dump())
-            log_model: Log[LogEntryType] = (
-                self.load() if self.exists else self.model_class([])
-            )
+        self.add_log_entries([log_entry])
+
+    def add_log_entries(self: Self, log_entries: Sequence[LogEntryType]) -> None:
+        """Adds several log entries to the log resource with a single write.
+
+        The log file is rewritten as a whole on every save, so adding related entries
+        together avoids rewriting it once per entry. No entries are added if any of
+        them is invalid.
+        """
+        if not log_entries:
+            return
+
+        validated_entries: list[LogEntryType] = []
+        for log_entry in log_entries:
+            try:
+                validated_entries.append(
+                    log_entry.model_validate(log_entry.model_dump())
+                )
+            except ValidationError as e:
+                raise ValueError(
+                    f"Invalid log entry added to '{self.model_class.__name__}' with "
+                    f"value '{log_entry}': '{e}"
+                ) from e
+
+        log_model: Log[LogEntryType] = (
+            self.load() if self.exists else self.model_class([])
+        )
+        for validated_entry in validated_entries:
             log_model.add_entry(validated_entry)
-            self.save(log_model)
-            self._cached_dataframe = None
-        except ValidationError as e:
-            raise ValueError(
-                f"Invalid log entry added to '{self.model_class.__name__}' with "
-                f"value '{log_entry}': '{e}"
-            ) from e
+        self.save(log_model)
+        self._cached_dataframe = None
 
     def filter_log(self: Self, filter: Filter) -> Log[LogEntryType]:
         """Filters the log resource with the provided filter."""
         if self._cached_dataframe is None:
+            # pandas is slow to import and only needed for filtering
+            import pandas as pd
+
             log_model: Log[LogEntryType] = self.load()
             if len(log_model) == 0:
                 self._cached_dataframe = pd.DataFrame()
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import copy
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Self
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Self
 
 from fmu.datamodels.context.mappings import (
     RelationType,
@@ -20,9 +20,18 @@ from fmu.settings.models.mappings import (
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from fmu.datamodels.context.mappings import StratigraphyIdentifierMapping
+
     # Avoid circular dependency for type hint in __init__ only
     from fmu.settings._fmu_dir import ProjectFMUDirectory
 
+_MAPPINGS_DIFF_LIST_KEYS: Final = MappingProxyType(
+    {
+        "stratigraphy.root": "__full__",
+        "wellbore.root": "__full__",
+    }
+)
+
 
 class MappingsManager(PydanticResourceManager[InternalMappings]):
     """Manages the .fmu mappings file."""
@@ -41,10 +50,7 @@ class MappingsManager(PydanticResourceManager[InternalMappings]):
     @property
     def diff_list_keys(self: Self) -> Mapping[str, str]:
         """List field identity keys used for per-item diffing."""
-        return {
-            "stratigraphy.root": "__full__",
-            "wellbore.root": "__full__",
-        }
+        return _MAPPINGS_DIFF_LIST_KEYS
 
     @property
     def internal_stratigraphy_mappings(self: Self) -> InternalStratigraphyMappings:
@@ -72,7 +78,7 @@ class MappingsManager(PydanticResourceManager[InternalMappings]):
         """Update stratigraphy mappings stored in the internal .fmu mappings format."""
         mappings: InternalMappings = self.load() if self.exists else InternalMappings()
 
-        old_mappings_dict = copy.deepcopy(mappings.model_dump())
+        old_mappings_dict = mappings.model_dump()
         mappings.stratigraphy = strat_mappings
         self.save(mappings)
 
@@ -90,7 +96,7 @@ class MappingsManager(PydanticResourceManager[InternalMappings]):
         """Update wellbore mappings stored in the internal .fmu mappings format."""
         mappings: InternalMappings = self.load() if self.exists else InternalMappings()
 
-        old_mappings_dict = copy.deepcopy(mappings.model_dump())
+        old_mappings_dict = mappings.model_dump()
         mappings.wellbore = wellbore_mappings
         self.save(mappings)
 
@@ -158,24 +164,27 @@ class MappingsManager(PydanticResourceManager[InternalMappings]):
         aliases_by_target_id: dict[
             str, list[str]
         ] = {}  # target_id -> [alias source_ids]
+        primaries: list[StratigraphyIdentifierMapping] = []
 
-        # Stratigraphic entries from stratigraphy mappings
+        # Stratigraphic entries from stratigraphy mappings, split by relation type
+        # in one pass
         for mapping in stratigraphy_mappings:
             if mapping.relation_type == RelationType.alias:
                 aliases_by_target_id.setdefault(mapping.target_id, []).append(
                     mapping.source_id
                 )
-
-        for mapping in stratigraphy_mappings:
-            if mapping.relation_type == RelationType.primary:
-                entry: dict[str, Any] = {
-                    "stratigraphic": True,
-                    "name": mapping.target_id,
-                    "uuid": mapping.target_uuid,
-                }
-                if aliases := aliases_by_target_id.get(mapping.target_id):
-                    entry["alias"] = aliases
-                stratigraphy[mapping.source_id] = entry
+            elif mapping.relation_type == RelationType.primary:
+                primaries.append(mapping)
+
+        for mapping in primaries:
+            entry: dict[str, Any] = {
+                "stratigraphic": True,
+                "name": mapping.target_id,
+                "uuid": mapping.target_uuid,
+            }
+            if aliases := aliases_by_target_id.get(mapping.target_id):
+                entry["alias"] = aliases
+            stratigraphy[mapping.source_id] = entry
 
         # Non-stratigraphic entries from RMS
         rms_config = self.fmu_dir.get_config_value("rms")
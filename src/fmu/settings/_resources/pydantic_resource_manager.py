@@ -84,14 +84,13 @@ class PydanticResourceManager(Generic[PydanticResource]):
         Returns:
             The value or default
         """
-        parts = key.split(".")
-        value = resource_dict
-        for part in parts:
-            if isinstance(value, dict) and part in value:
+        value: Any = resource_dict
+        try:
+            for part in key.split("."):
                 value = value[part]
-            else:
-                return default
-
+        except (KeyError, TypeError):
+            # A missing key, or a part that walks into a non-dict value
+            return default
         return value
 
     def load(
@@ -113,30 +112,31 @@ class PydanticResourceManager(Generic[PydanticResource]):
             model schema
         """
         if self._cache is None or force:
-            if not self.exists:
+            try:
+                content = self.fmu_dir.read_text_file(self.relative_path)
+            except (FileNotFoundError, NotADirectoryError) as e:
                 raise FileNotFoundError(
                     f"Resource file for '{self.__class__.__name__}' not found "
                     f"at: '{self.path}'"
-                )
+                ) from e
 
             try:
-                content = self.fmu_dir.read_text_file(self.relative_path)
-                data = json.loads(content)
-                validated_model = self.model_class.model_validate(data)
+                # Parses and validates in one pass, without an intermediate dict
+                validated_model = self.model_class.model_validate_json(content)
                 if store_cache:
                     self._cache = validated_model
                 else:
                     return validated_model
             except ValidationError as e:
+                if any(error["type"] == "json_invalid" for error in e.errors()):
+                    raise ValueError(
+                        "Invalid JSON in resource file for "
+                        f"'{self.__class__.__name__}': '{e}'"
+                    ) from e
                 raise ValueError(
                     f"Invalid content in resource file for '{self.__class__.__name__}: "
                     f"'{e}"
                 ) from e
-            except json.JSONDecodeError as e:
-                raise ValueError(
-                    f"Invalid JSON in resource file for '{self.__class__.__name__}': "
-                    f"'{e}'"
-                ) from e
 
         return self._cache
 
@@ -178,7 +178,7 @@ class PydanticResourceManager(Generic[PydanticResource]):
             )
 
         changes: list[tuple[str, Any, Any]] = []
-        diff_ignore_fields = getattr(self, "diff_ignore_fields", [])
+        diff_ignore_fields = getattr(self, "diff_ignore_fields", ())
 
         for field_name in type(current_model).model_fields:
             if field_name in diff_ignore_fields:
@@ -225,11 +225,12 @@ class PydanticResourceManager(Generic[PydanticResource]):
         change.
         """
         changes = self.get_model_diff(current_model, incoming_model)
+        diff_list_keys = self.diff_list_keys
 
         results: list[ResourceDiff] = []
 
         for field_path, before, after in changes:
-            list_key = self.diff_list_keys.get(field_path)
+            list_key = diff_list_keys.get(field_path)
             if list_key is None:
                 results.append(
                     ScalarFieldDiff(
@@ -346,7 +347,7 @@ class MutablePydanticResourceManager(PydanticResourceManager[MutablePydanticReso
             resource = self.load()
 
             if "." in key:
-                return self._get_dot_notation_key(resource.model_dump(), key, default)
+                return self._get_model_dot_notation_key(resource, key, default)
 
             if hasattr(resource, key):
                 return getattr(resource, key)
@@ -359,6 +360,41 @@ class MutablePydanticResourceManager(PydanticResourceManager[MutablePydanticReso
                 f"at: '{self.path}' when getting key {key}"
             ) from e
 
+    def _get_model_dot_notation_key(
+        self: Self, resource: BaseModel, key: str, default: Any = None
+    ) -> Any:
+        """Get a value from a resource model by a dot-notation key.
+
+        Nested models are walked by attribute and only the field the walk stops at
+        is dumped, so the result matches a lookup in resource.model_dump() without
+        serializing the whole resource.
+
+        Args:
+            resource: The resource model to get the value from
+            key: The key to the value in the resource
+            default: Value to return if key is not found. Default None
+
+        Returns:
+            The value or default
+        """
+        parts = key.split(".")
+        model = resource
+        depth = 0
+        while depth < len(parts) - 1:
+            part = parts[depth]
+            child = getattr(model, part) if part in type(model).model_fields else None
+            if not isinstance(child, BaseModel):
+                break
+            model = child
+            depth += 1
+
+        field = parts[depth]
+        # Extra or unknown fields fall back to dumping the model the walk stopped at
+        include = {field} if field in type(model).model_fields else None
+        return self._get_dot_notation_key(
+            model.model_dump(include=include), ".".join(parts[depth:]), default
+        )
+
     def _set_dot_notation_key(
         self: Self, resource_dict: dict[str, Any], key: str, value: Any
     ) -> None:
@@ -369,15 +405,92 @@ class MutablePydanticResourceManager(PydanticResourceManager[MutablePydanticReso
             key: The key to set
             value: The value to set
         """
-        parts = key.split(".")
+        *parents, last = key.split(".")
         target = resource_dict
 
-        for part in parts[:-1]:
-            if part not in target or not isinstance(target[part], dict):
-                target[part] = {}
-            target = target[part]
+        for part in parents:
+            child = target.get(part)
+            if not isinstance(child, dict):
+                # Missing or non-dict values (e.g. None) are replaced by a new dict
+                child = target[part] = {}
+            target = child
+
+        target[last] = value
+
+    def _apply_updates(
+        self: Self, resource: MutablePydanticResource, updates: dict[str, Any]
+    ) -> MutablePydanticResource:
+        """Returns a validated copy of the resource with the updates applied.
+
+        Plain keys are applied before dot-notation keys. When every key is within a
+        top-level field and the model has no model validators, only the updated
+        fields are validated, as on attribute assignment. Otherwise the whole
+        resource is validated again.
+
+        Raises:
+            ValidationError: If the updated resource is invalid
+        """
+        top_level_keys = {key.partition(".")[0] for key in updates}
+        if (
+            self.model_class.__pydantic_decorators__.model_validators
+            or not top_level_keys <= self.model_class.model_fields.keys()
+        ):
+            resource_dict = resource.model_dump()
+            resource_dict.update({k: v for k, v in updates.items() if "." not in k})
+            for key, value in updates.items():
+                if "." in key:
+                    self._set_dot_notation_key(resource_dict, key, value)
+            return resource.model_validate(resource_dict)
+
+        # Only the updated fields are dumped, changed, and validated
+        field_values = {k: v for k, v in updates.items() if "." not in k}
+        for key, value in updates.items():
+            if "." in key:
+                field = key.partition(".")[0]
+                if field not in field_values:
+                    field_values |= resource.model_dump(include={field})
+                self._set_dot_notation_key(field_values, key, value)
+
+        updated_resource = resource.model_copy()
+        validator = self.model_class.__pydantic_validator__
+        for field, value in field_values.items():
+            validator.validate_assignment(updated_resource, field, value)
+        return updated_resource
+
+    def _is_unknown_keys_noop(
+        self: Self,
+        resource: MutablePydanticResource,
+        updated_resource: MutablePydanticResource,
+        updates: dict[str, Any],
+    ) -> bool:
+        """Whether updates only named keys that validation dropped from the resource.
+
+        Setting a known field always counts as a modification, even to its current
+        value, so only updates that touch no model field can be skipped.
+        """
+        fields = self.model_class.model_fields
+        return (
+            not any(key.partition(".")[0] in fields for key in updates)
+            and updated_resource == resource
+        )
+
+    def _save_updates(self: Self, updates: dict[str, Any]) -> bool:
+        """Applies updates to the loaded resource and saves it if anything changed.
+
+        Returns:
+            True if the resource was written, False if the updates only named keys
+            that validation dropped
 
-        target[parts[-1]] = value
+        Raises:
+            FileNotFoundError: If resource file doesn't exist
+            ValidationError: If the updated resource is invalid
+        """
+        resource = self.load()
+        updated_resource = self._apply_updates(resource, updates)
+        if self._is_unknown_keys_noop(resource, updated_resource, updates):
+            return False
+        self.save(updated_resource)
+        return True
 
     def set(self: Self, key: str, value: Any) -> None:
         """Sets a resource value by key.
@@ -390,18 +503,20 @@ class MutablePydanticResourceManager(PydanticResourceManager[MutablePydanticReso
             FileNotFoundError: If resource file doesn't exist
             ValueError: If the updated resource is invalid
         """
-        try:
-            resource = self.load()
-            resource_dict = resource.model_dump()
+        self._set(key, value)
 
-            if "." in key:
-                self._set_dot_notation_key(resource_dict, key, value)
-            else:
-                resource_dict[key] = value
+    def _set(self: Self, key: str, value: Any) -> bool:
+        """Sets a resource value by key.
 
-            updated_resource = resource.model_validate(resource_dict)
-            self.save(updated_resource)
+        Returns:
+            True if the resource was written, False if the key names no field
 
+        Raises:
+            FileNotFoundError: If resource file doesn't exist
+            ValueError: If the updated resource is invalid
+        """
+        try:
+            return self._save_updates({key: value})
         except ValidationError as e:
             raise ValueError(
                 f"Invalid value set for '{self.__class__.__name__}' with "
@@ -426,20 +541,21 @@ class MutablePydanticResourceManager(PydanticResourceManager[MutablePydanticReso
             FileNotFoundError: If resource file doesn't exist
             ValueError: If the updates resource is invalid
         """
-        try:
-            resource = self.load()
-            resource_dict = resource.model_dump()
-
-            flat_updates = {k: v for k, v in updates.items() if "." not in k}
-            resource_dict.update(flat_updates)
+        self._update(updates)
+        return self.load()
 
-            for key, value in updates.items():
-                if "." in key:
-                    self._set_dot_notation_key(resource_dict, key, value)
+    def _update(self: Self, updates: dict[str, Any]) -> bool:
+        """Updates multiple resource values at once.
 
-            updated_resource = resource.model_validate(resource_dict)
-            self.save(updated_resource)
+        Returns:
+            True if the resource was written, False if no key names a field
 
+        Raises:
+            FileNotFoundError: If resource file doesn't exist
+            ValueError: If the updates resource is invalid
+        """
+        try:
+            return self._save_updates(updates)
         except ValidationError as e:
             raise ValueError(
                 f"Invalid value set for '{self.__class__.__name__}' with "
@@ -451,8 +567,6 @@ class MutablePydanticResourceManager(PydanticResourceManager[MutablePydanticReso
                 f"at: '{self.path}' when setting updates {updates}"
             ) from e
 
-        return self.load()
-
     def reset(self: Self) -> MutablePydanticResource:
         """Resets the resources to defaults.
 
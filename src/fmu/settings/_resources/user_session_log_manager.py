@@ -28,9 +28,13 @@ class UserSessionLogManager(LogManager[EventInfo]):
 
         # If user_session_log.json exists from previous session, cache it and delete
         # We want a fresh log each time
-        if self.exists:
-            self.fmu_dir._lock.ensure_can_write()
+        try:
             content = self.fmu_dir.read_text_file(self.relative_path)
+        except (FileNotFoundError, NotADirectoryError):
+            content = None
+
+        if content is not None:
+            self.fmu_dir._lock.ensure_can_write()
             self.fmu_dir.cache.store_revision(
                 self.relative_path, content, skip_trim=True
             )
@@ -1,7 +1,9 @@
-"""Utilities for path checks that only hide missing-path errors."""
+"""Utilities for path checks and looking up the current user."""
 
 from __future__ import annotations
 
+import functools
+import getpass
 import stat
 from typing import TYPE_CHECKING
 
@@ -32,3 +34,14 @@ def path_is_file(path: Path) -> bool:
         return stat.S_ISREG(path.stat().st_mode)
     except (FileNotFoundError, NotADirectoryError):
         return False
+
+
+@functools.cache
+def current_user() -> str:
+    """Return the name of the user running this process.
+
+    getpass.getuser() can fall back to a password database lookup, which may go over
+    the network (LDAP/SSSD). The user does not change during a process, so the name
+    is looked up once.
+    """
+    return getpass.getuser()
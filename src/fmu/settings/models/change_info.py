@@ -1,9 +1,9 @@
 """Model for the log entries in the the changelog file."""
 
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
 
-import pandas as pd
 from pydantic import AwareDatetime, BaseModel, Field, field_validator
 
 from fmu.settings.models._enums import ChangeType
@@ -32,6 +32,8 @@ class ChangeInfo(BaseModel):
         """
         if isinstance(value, str):
             return datetime.fromisoformat(value)
-        if isinstance(value, pd.Timestamp):
+        # Only filtered logs hold Timestamps, and those have already imported pandas
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(value, pd.Timestamp):
             return value.to_pydatetime()
         return value
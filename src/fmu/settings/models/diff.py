@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ScalarFieldDiff(BaseModel):
     """Diff entry for non-list fields."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     field_path: str
     before: Any
     after: Any
@@ -18,6 +20,8 @@ class ScalarFieldDiff(BaseModel):
 class ListUpdatedEntry(BaseModel):
     """Before and after values for an updated list item."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     key: Any
     before: dict[str, Any]
     after: dict[str, Any]
@@ -26,6 +30,8 @@ class ListUpdatedEntry(BaseModel):
 class ListFieldDiff(BaseModel):
     """Diff entry for list fields with per-item changes."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     field_path: str
     added: list[dict[str, Any]]
     removed: list[dict[str, Any]]
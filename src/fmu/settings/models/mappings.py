@@ -2,10 +2,18 @@
 
 from collections.abc import Iterator, Sequence
 from enum import StrEnum
-from typing import Any, Literal, Self
+from types import MappingProxyType
+from typing import Any, Final, Generic, Literal, Self, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    field_validator,
+    model_validator,
+)
 
 from fmu.datamodels.context.mappings import (
     DataSystem,
@@ -31,6 +39,11 @@ class InternalRelationType(StrEnum):
     """A source identifier that has been reviewed and cannot be mapped."""
 
 
+_DATAMODELS_RELATION_TYPES: Final = MappingProxyType(
+    {member.value: member for member in RelationType}
+)
+
+
 class InternalBaseMapping(BaseModel):
     """Base fields for internal mappings stored in .fmu/mappings.json.
 
@@ -38,6 +51,8 @@ class InternalBaseMapping(BaseModel):
     same-system relationships and unmappable source identifiers.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     source_system: DataSystem
     target_system: DataSystem
     mapping_type: MappingType
@@ -161,17 +176,17 @@ class InternalWellboreIdentifierMapping(InternalIdentifierMapping):
     mapping_type: Literal[MappingType.wellbore] = MappingType.wellbore
 
 
-class InternalStratigraphyMappings(
-    RootModel[list[InternalStratigraphyIdentifierMapping]]
+_InternalMappingT = TypeVar("_InternalMappingT", bound=InternalIdentifierMapping)
+
+
+class _InternalMappingsCollection(
+    RootModel[list[_InternalMappingT]], Generic[_InternalMappingT]
 ):
-    """Collection of stratigraphy mappings stored in .fmu/mappings.json.
+    """Shared validation and list access for internal mapping collections."""
 
-    This internal model can keep same-system alias information and unmappable
-    relation. Converting to fmu-datamodels drops unmappable entries and expands
-    same-system aliases onto matching cross-system primary mappings.
-    """
+    model_config = ConfigDict(defer_build=True)
 
-    root: list[InternalStratigraphyIdentifierMapping]
+    root: list[_InternalMappingT]
 
     @model_validator(mode="after")
     def validate_collection(self: Self) -> Self:
@@ -179,6 +194,29 @@ class InternalStratigraphyMappings(
         _validate_identifier_mappings_collection(self.root)
         return self
 
+    def __getitem__(self: Self, index: int) -> _InternalMappingT:
+        """Retrieve a mapping from the list by index."""
+        return self.root[index]
+
+    def __iter__(self: Self) -> Iterator[_InternalMappingT]:  # type: ignore[override]
+        """Return an iterator for the mappings."""
+        return iter(self.root)
+
+    def __len__(self: Self) -> int:
+        """Return the number of mappings."""
+        return len(self.root)
+
+
+class InternalStratigraphyMappings(
+    _InternalMappingsCollection[InternalStratigraphyIdentifierMapping]
+):
+    """Collection of stratigraphy mappings stored in .fmu/mappings.json.
+
+    This internal model can keep same-system alias information and unmappable
+    relation. Converting to fmu-datamodels drops unmappable entries and expands
+    same-system aliases onto matching cross-system primary mappings.
+    """
+
     def to_stratigraphy_mappings(self: Self) -> StratigraphyMappings:
         """Convert internal .fmu mappings to fmu-datamodels StratigraphyMappings."""
         return StratigraphyMappings(
@@ -188,20 +226,10 @@ class InternalStratigraphyMappings(
             ]
         )
 
-    def __getitem__(self: Self, index: int) -> InternalStratigraphyIdentifierMapping:
-        """Retrieve a stratigraphy mapping from the list by index."""
-        return self.root[index]
-
-    def __iter__(self: Self) -> Iterator[InternalStratigraphyIdentifierMapping]:  # type: ignore[override]
-        """Return an iterator for the stratigraphy mappings."""
-        return iter(self.root)
-
-    def __len__(self: Self) -> int:
-        """Return the number of stratigraphy mappings."""
-        return len(self.root)
 
-
-class InternalWellboreMappings(RootModel[list[InternalWellboreIdentifierMapping]]):
+class InternalWellboreMappings(
+    _InternalMappingsCollection[InternalWellboreIdentifierMapping]
+):
     """Collection of wellbore mappings stored in .fmu/mappings.json.
 
     This internal model can keep same-system alias information and unmappable
@@ -209,14 +237,6 @@ class InternalWellboreMappings(RootModel[list[InternalWellboreIdentifierMapping]
     same-system aliases onto matching cross-system primary mappings.
     """
 
-    root: list[InternalWellboreIdentifierMapping]
-
-    @model_validator(mode="after")
-    def validate_collection(self: Self) -> Self:
-        """Ensure the mapping collection follows the allowed mapping rules."""
-        _validate_identifier_mappings_collection(self.root)
-        return self
-
     def to_wellbore_mappings(self: Self) -> WellboreMappings:
         """Convert internal .fmu mappings to fmu-datamodels WellboreMappings."""
         return WellboreMappings(
@@ -226,22 +246,12 @@ class InternalWellboreMappings(RootModel[list[InternalWellboreIdentifierMapping]
             ]
         )
 
-    def __getitem__(self: Self, index: int) -> InternalWellboreIdentifierMapping:
-        """Retrieve a wellbore mapping from the list by index."""
-        return self.root[index]
-
-    def __iter__(self: Self) -> Iterator[InternalWellboreIdentifierMapping]:  # type: ignore[override]
-        """Return an iterator for the wellbore mappings."""
-        return iter(self.root)
-
-    def __len__(self: Self) -> int:
-        """Return the number of wellbore mappings."""
-        return len(self.root)
-
 
 class InternalMappings(BaseModel):
     """Represents the .fmu/mappings.json storage schema."""
 
+    model_config = ConfigDict(defer_build=True)
+
     schema_version: Literal[1] = 1
     """The version of the data schema defined by this data model."""
 
@@ -326,14 +336,14 @@ def _validate_identifier_mappings_collection(
     """
     same_system_source_keys: set[tuple[DataSystem, MappingType, str]] = set()
     same_system_primary_source_keys: set[tuple[DataSystem, MappingType, str]] = set()
-    same_system_aliases: list[InternalIdentifierMapping] = []
+    alias_primary_keys: set[tuple[DataSystem, MappingType, str]] = set()
+    cross_system_primary_keys: set[tuple[DataSystem, MappingType, str]] = set()
     cross_system_source_keys: set[tuple[MappingType, DataSystem, DataSystem, str]] = (
         set()
     )
     cross_system_target_keys: set[tuple[MappingType, DataSystem, DataSystem, str]] = (
         set()
     )
-    cross_system_mappings: list[InternalIdentifierMapping] = []
 
     for mapping in mappings:
         source_key = (
@@ -352,7 +362,11 @@ def _validate_identifier_mappings_collection(
             if mapping.relation_type == InternalRelationType.primary:
                 same_system_primary_source_keys.add(source_key)
             else:
-                same_system_aliases.append(mapping)
+                # The primary this alias points to is checked after the loop
+                assert mapping.target_id is not None
+                alias_primary_keys.add(
+                    (mapping.source_system, mapping.mapping_type, mapping.target_id)
+                )
             continue
 
         # A source_id can map to each target system only once.
@@ -383,37 +397,23 @@ def _validate_identifier_mappings_collection(
                 )
             cross_system_target_keys.add(cross_system_target_key)
 
-        cross_system_mappings.append(mapping)
+        cross_system_primary_keys.add(source_key)
 
-    # Every alias must point to a same-system primary source_id that already
-    # exists in the collection.
-    for mapping in same_system_aliases:
-        primary_target_id = mapping.target_id
-        assert primary_target_id is not None
-        primary_target_key = (
-            mapping.source_system,
-            mapping.mapping_type,
-            primary_target_id,
+    # Every alias must point to a same-system primary source_id that exists in
+    # the collection.
+    if not alias_primary_keys <= same_system_primary_source_keys:
+        raise ValueError(
+            "Same-system alias mappings must point to an existing "
+            "same-system primary source_id"
         )
-        if primary_target_key not in same_system_primary_source_keys:
-            raise ValueError(
-                "Same-system alias mappings must point to an existing "
-                "same-system primary source_id"
-            )
 
     # Cross-system mappings are only allowed when they start from a same-system
     # primary source_id.
-    for mapping in cross_system_mappings:
-        primary_source_key = (
-            mapping.source_system,
-            mapping.mapping_type,
-            mapping.source_id,
+    if not cross_system_primary_keys <= same_system_primary_source_keys:
+        raise ValueError(
+            "Cross-system mappings must use a source_id that is defined "
+            "as a same-system primary"
         )
-        if primary_source_key not in same_system_primary_source_keys:
-            raise ValueError(
-                "Cross-system mappings must use a source_id that is defined "
-                "as a same-system primary"
-            )
 
 
 def _to_datamodels_identifier_mapping_payloads(
@@ -451,27 +451,31 @@ def _to_datamodels_identifier_mapping_payloads(
     aliases_by_primary: dict[
         tuple[MappingType, DataSystem, str], list[InternalIdentifierMapping]
     ] = {}
+    cross_system_primaries: list[InternalIdentifierMapping] = []
 
-    # Group same-system aliases by the same-system primary id they point to.
+    # Group same-system aliases by the same-system primary id they point to, and
+    # pick out the cross-system primaries in the same pass.
     for mapping in mappings:
         if _is_same_system_alias(mapping):
             assert mapping.target_id is not None
             aliases_by_primary.setdefault(
                 _primary_key(mapping, mapping.target_id), []
             ).append(mapping)
+        elif _is_cross_system_primary(mapping):
+            cross_system_primaries.append(mapping)
 
     mapping_payloads: list[dict[str, Any]] = []
 
     # Keep cross-system primaries and add matching aliases to the same target.
-    for mapping in mappings:
-        if not _is_cross_system_primary(mapping):
-            continue
-
-        mapping_payloads.append(_to_mapping_payload(mapping))
+    for mapping in cross_system_primaries:
+        primary_payload = _to_mapping_payload(mapping)
+        mapping_payloads.append(primary_payload)
         for alias_mapping in aliases_by_primary.get(
             _primary_key(mapping, mapping.source_id), []
         ):
-            alias_payload = _to_mapping_payload(mapping)
+            # The payload only holds immutable values, so a shallow copy of the
+            # primary's payload is enough and avoids dumping the model again
+            alias_payload = primary_payload.copy()
             alias_payload.update(
                 {
                     "relation_type": RelationType.alias,
@@ -512,5 +516,5 @@ def _primary_key(
 def _to_mapping_payload(mapping: InternalIdentifierMapping) -> dict[str, Any]:
     """Return a payload compatible with fmu-datamodels mapping models."""
     payload = mapping.model_dump()
-    payload["relation_type"] = RelationType(mapping.relation_type.value)
+    payload["relation_type"] = _DATAMODELS_RELATION_TYPES[mapping.relation_type]
     return payload
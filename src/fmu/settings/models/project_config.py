@@ -1,6 +1,5 @@
 """The model for config.json."""
 
-import getpass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal, Self
@@ -11,6 +10,7 @@ from fmu.datamodels.common.access import Access
 from fmu.datamodels.common.masterdata import Masterdata
 from fmu.datamodels.fmu_results.fields import Model
 from fmu.settings import __version__
+from fmu.settings._utils import current_user
 from fmu.settings.types import ResettableBaseModel, VersionStr  # noqa: TC001
 
 
@@ -125,7 +125,7 @@ class ProjectConfig(ResettableBaseModel):
         return cls(
             version=__version__,
             created_at=datetime.now(UTC),
-            created_by=getpass.getuser(),
+            created_by=current_user(),
             last_modified_at=None,
             last_modified_by=None,
             masterdata=None,
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Self, TypeAlias
+from typing import Annotated, Final, Self, TypeAlias
 
 from pydantic import BaseModel, Field
 
-VersionStr: TypeAlias = Annotated[
-    str, Field(pattern=r"(\d+(\.\d+){0,2}|\d+\.\d+\.[a-z0-9]+\+[a-z0-9.]+)")
-]
+_VERSION_PATTERN: Final = r"(\d+(\.\d+){0,2}|\d+\.\d+\.[a-z0-9]+\+[a-z0-9.]+)"
+
+VersionStr: TypeAlias = Annotated[str, Field(pattern=_VERSION_PATTERN)]
 
 
 class ResettableBaseModel(BaseModel):
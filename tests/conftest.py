@@ -1,10 +1,12 @@
 """Root configuration for pytest."""
 
+import functools
+import shutil
 import stat
 from collections.abc import Callable, Iterator
 from contextlib import AbstractContextManager, contextmanager
 from copy import deepcopy
-from datetime import UTC, datetime
+from datetime import UTC, datetime, tzinfo
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -70,12 +72,18 @@ def no_permissions() -> Callable[[str | Path], AbstractContextManager[None]]:
     return ctx_manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unix_epoch_utc() -> datetime:
     """Returns a fixed datetime used in testing."""
     return datetime(1970, 1, 1, 0, 0, tzinfo=UTC)
 
 
+@pytest.fixture(scope="session")
+def empty_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty directory shared by tests that must not write to it."""
+    return tmp_path_factory.mktemp("empty", numbered=False)
+
+
 @pytest.fixture
 def fmu_project_root(tmp_path: Path) -> Path:
     """Create the minimum directory layout for an FMU project root."""
@@ -415,82 +423,72 @@ def user_config_model(user_config_dict: dict[str, Any]) -> UserConfig:
     return UserConfig.model_validate(user_config_dict)
 
 
-@pytest.fixture(scope="function")
-def fmu_dir(fmu_project_root: Path, unix_epoch_utc: datetime) -> ProjectFMUDirectory:
-    """Create an ProjectFMUDirectory instance for testing."""
-    with (
-        patch(
-            "fmu.settings.models.project_config.getpass.getuser",
-            return_value="user",
-        ),
-        patch(
-            "fmu.settings._resources.config_managers.getpass.getuser",
-            return_value="user",
-        ),
-        patch("fmu.settings.models.project_config.datetime") as mock_datetime,
-        patch("fmu.settings._resources.config_managers.datetime") as mock_cm_datetime,
-    ):
-        mock_datetime.now.return_value = unix_epoch_utc
-        mock_datetime.datetime.now.return_value = unix_epoch_utc
-        mock_cm_datetime.now.return_value = unix_epoch_utc
-        fmu_directory = init_fmu_directory(fmu_project_root)
+@functools.cache
+def _frozen_datetime(now: datetime) -> type[datetime]:
+    """Return a datetime class whose now() always returns the given time."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+            return now
+
+    return FrozenDatetime
+
+
+@contextmanager
+def _fixed_project_config_user_and_time(now: datetime) -> Iterator[None]:
+    """Fix the user and time stamped into project configs while active."""
+    with MonkeyPatch.context() as mp:
+        for module in (
+            "fmu.settings.models.project_config",
+            "fmu.settings._resources.config_managers",
+        ):
+            mp.setattr(f"{module}.current_user", lambda: "user")
+            mp.setattr(f"{module}.datetime", _frozen_datetime(now))
+        yield
+
+
+@pytest.fixture(scope="session")
+def fmu_dir_template(
+    tmp_path_factory: pytest.TempPathFactory, unix_epoch_utc: datetime
+) -> Path:
+    """Initialize a project .fmu directory once to be copied by fmu_dir fixtures."""
+    project_root = tmp_path_factory.mktemp("fmu_dir_template")
+    for dir_name in REQUIRED_FMU_PROJECT_SUBDIRS:
+        (project_root / dir_name).mkdir(parents=True, exist_ok=True)
+    with _fixed_project_config_user_and_time(unix_epoch_utc):
+        fmu_directory = init_fmu_directory(project_root)
         if fmu_directory.changelog.exists:
             fmu_directory.changelog.path.unlink()
-            fmu_directory.changelog._cache = None
-        return fmu_directory
+    return fmu_directory.path
+
+
+@pytest.fixture(scope="function")
+def fmu_dir(fmu_project_root: Path, fmu_dir_template: Path) -> ProjectFMUDirectory:
+    """Create an ProjectFMUDirectory instance for testing."""
+    shutil.copytree(fmu_dir_template, fmu_project_root / ".fmu")
+    return ProjectFMUDirectory(fmu_project_root)
 
 
 @pytest.fixture(scope="function")
 def drogon_fmu_dir(tmp_path: Path, unix_epoch_utc: datetime) -> ProjectFMUDirectory:
     """Create an ProjectFMUDirectory instance for testing."""
-    with (
-        patch(
-            "fmu.settings.models.project_config.getpass.getuser",
-            return_value="user",
-        ),
-        patch(
-            "fmu.settings._resources.config_managers.getpass.getuser",
-            return_value="user",
-        ),
-        patch("fmu.settings.models.project_config.datetime") as mock_datetime,
-        patch("fmu.settings._resources.config_managers.datetime") as mock_cm_datetime,
-    ):
-        mock_datetime.now.return_value = unix_epoch_utc
-        mock_datetime.datetime.now.return_value = unix_epoch_utc
-        mock_cm_datetime.now.return_value = unix_epoch_utc
+    with _fixed_project_config_user_and_time(unix_epoch_utc):
         return create_drogon_fmu_dir(tmp_path)
 
 
 @pytest.fixture(scope="function")
 def extra_fmu_dir(
     fmu_project_root: Path,
-    unix_epoch_utc: datetime,
+    fmu_dir_template: Path,
 ) -> ProjectFMUDirectory:
     """Create an extra ProjectFMUDirectory instance for testing of diff and sync."""
     extra_fmu_path = fmu_project_root / Path("extra_fmu")
     extra_fmu_path.mkdir(parents=True)
     for dir_name in REQUIRED_FMU_PROJECT_SUBDIRS:
         (extra_fmu_path / dir_name).mkdir(parents=True, exist_ok=True)
-    with (
-        patch(
-            "fmu.settings.models.project_config.getpass.getuser",
-            return_value="user",
-        ),
-        patch(
-            "fmu.settings._resources.config_managers.getpass.getuser",
-            return_value="user",
-        ),
-        patch("fmu.settings.models.project_config.datetime") as mock_datetime,
-        patch("fmu.settings._resources.config_managers.datetime") as mock_cm_datetime,
-    ):
-        mock_datetime.now.return_value = unix_epoch_utc
-        mock_datetime.datetime.now.return_value = unix_epoch_utc
-        mock_cm_datetime.now.return_value = unix_epoch_utc
-        fmu_directory = init_fmu_directory(extra_fmu_path)
-        if fmu_directory.changelog.exists:
-            fmu_directory.changelog.path.unlink()
-            fmu_directory.changelog._cache = None
-        return fmu_directory
+    shutil.copytree(fmu_dir_template, extra_fmu_path / ".fmu")
+    return ProjectFMUDirectory(extra_fmu_path)
 
 
 @pytest.fixture
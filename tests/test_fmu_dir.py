@@ -4,6 +4,7 @@ import copy
 import inspect
 import json
 import shutil
+import stat
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -22,6 +23,7 @@ from fmu.settings import (
     get_fmu_directory,
 )
 from fmu.settings._fmu_dir import (
+    _FILE_PATH_CACHE_SIZE,
     FMUDirectoryBase,
     ProjectFMUDirectory,
     UserFMUDirectory,
@@ -30,6 +32,7 @@ from fmu.settings._readme_texts import PROJECT_README_CONTENT, USER_README_CONTE
 from fmu.settings._resources.changelog_manager import ChangelogManager
 from fmu.settings._resources.lock_manager import DEFAULT_LOCK_TIMEOUT, LockManager
 from fmu.settings._resources.mappings_manager import MappingsManager
+from fmu.settings._utils import path_is_dir
 from fmu.settings.models._enums import ChangeType
 from fmu.settings.models.change_info import ChangeInfo
 from fmu.settings.models.log import Log
@@ -64,18 +67,28 @@ def _stratigraphy_mappings(
     )
 
 
-def test_init_existing_directory(fmu_dir: ProjectFMUDirectory) -> None:
+@pytest.fixture(scope="module")
+def fmu_dir_ro(
+    tmp_path_factory: pytest.TempPathFactory, fmu_dir_template: Path
+) -> ProjectFMUDirectory:
+    """A ProjectFMUDirectory shared by tests in this module that only read from it."""
+    project_root = tmp_path_factory.mktemp("fmu_dir_ro")
+    shutil.copytree(fmu_dir_template, project_root / ".fmu")
+    return ProjectFMUDirectory(project_root)
+
+
+def test_init_existing_directory(fmu_dir_ro: ProjectFMUDirectory) -> None:
     """Tests initializing an ProjectFMUDirectory on an existing .fmu directory."""
-    fmu = ProjectFMUDirectory(fmu_dir.base_path)
-    assert fmu.path == fmu_dir.path
-    assert fmu.base_path == fmu_dir.base_path
+    fmu = ProjectFMUDirectory(fmu_dir_ro.base_path)
+    assert fmu.path == fmu_dir_ro.path
+    assert fmu.base_path == fmu_dir_ro.base_path
 
 
-def test_get_fmu_directory(fmu_dir: ProjectFMUDirectory) -> None:
+def test_get_fmu_directory(fmu_dir_ro: ProjectFMUDirectory) -> None:
     """Tests initializing an ProjectFMUDirectory via get_fmu_directory."""
-    fmu = get_fmu_directory(fmu_dir.base_path)
-    assert fmu.path == fmu_dir.path
-    assert fmu.base_path == fmu_dir.base_path
+    fmu = get_fmu_directory(fmu_dir_ro.base_path)
+    assert fmu.path == fmu_dir_ro.path
+    assert fmu.base_path == fmu_dir_ro.base_path
 
 
 def test_find_nearest_fmu_directory(
@@ -104,12 +117,25 @@ def test_find_nearest_fmu_directory(
     assert fmu.base_path == fmu_dir.base_path
 
 
-def test_init_on_missing_directory(tmp_path: Path) -> None:
+def test_init_on_missing_directory(empty_dir: Path) -> None:
     """Tests initializing with a missing directory raises."""
     with pytest.raises(
-        FileNotFoundError, match=f"No .fmu directory found at {tmp_path}"
+        FileNotFoundError, match=f"No .fmu directory found at {empty_dir}"
     ):
-        ProjectFMUDirectory(tmp_path)
+        ProjectFMUDirectory(empty_dir)
+
+
+def test_init_on_missing_directory_builds_no_managers(empty_dir: Path) -> None:
+    """Tests a missing .fmu directory raises before any manager is created."""
+    with (
+        patch("fmu.settings._fmu_dir.ProjectConfigManager") as config_manager,
+        patch("fmu.settings._fmu_dir.LockManager") as lock_manager,
+        pytest.raises(FileNotFoundError),
+    ):
+        ProjectFMUDirectory(empty_dir)
+
+    config_manager.assert_not_called()
+    lock_manager.assert_not_called()
 
 
 def test_init_when_fmu_is_not_a_directory(tmp_path: Path) -> None:
@@ -153,15 +179,47 @@ def test_find_fmu_directory(fmu_dir: ProjectFMUDirectory) -> None:
     assert found_dir == fmu_dir.path
 
 
-def test_find_fmu_directory_not_found(tmp_path: Path) -> None:
+def test_find_fmu_directory_not_found(empty_dir: Path) -> None:
     """Tests find_fmu_directory() returns None if no .fmu found."""
-    empty_dir = tmp_path / "empty"
-    empty_dir.mkdir()
-
     found_dir = ProjectFMUDirectory.find_fmu_directory(empty_dir)
     assert found_dir is None
 
 
+def test_find_fmu_directory_skips_home(tmp_path: Path) -> None:
+    """Tests find_fmu_directory() does not return or check $HOME/.fmu."""
+    (tmp_path / ".fmu").mkdir()
+    child = tmp_path / "child"
+    child.mkdir()
+
+    with (
+        patch("pathlib.Path.home", return_value=tmp_path),
+        patch("fmu.settings._fmu_dir.path_is_dir", return_value=False) as is_dir,
+    ):
+        assert ProjectFMUDirectory.find_fmu_directory(child) is None
+
+    checked = [call.args[0] for call in is_dir.call_args_list]
+    assert child / ".fmu" in checked
+    assert tmp_path / ".fmu" not in checked
+
+
+def test_find_fmu_directory_checks_each_parent_once(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Tests find_fmu_directory() skips $HOME/.fmu and checks each level once."""
+    home = tmp_path / "home"
+    start = home / "project"
+    start.mkdir(parents=True)
+    (home / ".fmu").mkdir()
+    (tmp_path / ".fmu").mkdir()
+    monkeypatch.setattr(Path, "home", lambda: home)
+
+    with patch("fmu.settings._fmu_dir.path_is_dir", wraps=path_is_dir) as is_dir:
+        assert ProjectFMUDirectory.find_fmu_directory(start) == tmp_path / ".fmu"
+
+    checked = [call.args[0] for call in is_dir.call_args_list]
+    assert checked == [start / ".fmu", tmp_path / ".fmu"]
+
+
 def test_find_nearest(fmu_dir: ProjectFMUDirectory) -> None:
     """Test find_nearest factory method."""
     subdir = fmu_dir.base_path / "subdir"
@@ -171,17 +229,17 @@ def test_find_nearest(fmu_dir: ProjectFMUDirectory) -> None:
     assert fmu.path == fmu_dir.path
 
 
-def test_find_nearest_not_found(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+def test_find_nearest_not_found(empty_dir: Path, monkeypatch: MonkeyPatch) -> None:
     """Test find_nearest raises FileNotFoundError when not found."""
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(empty_dir)
     with pytest.raises(
-        FileNotFoundError, match=f"No .fmu directory found at or above {tmp_path}"
+        FileNotFoundError, match=f"No .fmu directory found at or above {empty_dir}"
     ):
         ProjectFMUDirectory.find_nearest()
     with pytest.raises(
-        FileNotFoundError, match=f"No .fmu directory found at or above {tmp_path}"
+        FileNotFoundError, match=f"No .fmu directory found at or above {empty_dir}"
     ):
-        ProjectFMUDirectory.find_nearest(tmp_path)
+        ProjectFMUDirectory.find_nearest(empty_dir)
 
 
 def test_cache_property_returns_cached_manager(fmu_dir: ProjectFMUDirectory) -> None:
@@ -338,21 +396,18 @@ def test_restore_from_cache_raises_for_unsupported_resource(
         fmu_dir.restore_from_cache("unsupported.json", "missing.json")
 
 
-def test_get_config_value(fmu_dir: ProjectFMUDirectory) -> None:
+def test_get_config_value(fmu_dir_ro: ProjectFMUDirectory) -> None:
     """Tests get_config_value retrieves correctly from the config."""
-    assert fmu_dir.get_config_value("version") == __version__
-    assert fmu_dir.get_config_value("created_by") == "user"
+    assert fmu_dir_ro.get_config_value("version") == __version__
+    assert fmu_dir_ro.get_config_value("created_by") == "user"
 
 
 def test_set_config_value(fmu_dir: ProjectFMUDirectory) -> None:
     """Tests set_config_value sets and writes the result."""
     fmu_dir.set_config_value("version", "200.0.0")
-    with open(fmu_dir.config.path, encoding="utf-8") as f:
-        config_dict = json.loads(f.read())
 
-    assert config_dict["version"] == "200.0.0"
     assert fmu_dir.get_config_value("version") == "200.0.0"
-    assert fmu_dir.config.load().version == "200.0.0"
+    assert fmu_dir.config.load(force=True).version == "200.0.0"
 
 
 def test_update_config(fmu_dir: ProjectFMUDirectory) -> None:
@@ -362,16 +417,22 @@ def test_update_config(fmu_dir: ProjectFMUDirectory) -> None:
     assert updated_config.version == "2.0.0"
     assert updated_config.created_by == "user2"
 
-    assert fmu_dir.config.load() is not None
     assert fmu_dir.get_config_value("version", None) == "2.0.0"
     assert fmu_dir.get_config_value("created_by", None) == "user2"
 
-    config_file = fmu_dir.config.path
-    with open(config_file, encoding="utf-8") as f:
+    saved_config = fmu_dir.config.load(force=True)
+    assert saved_config.version == "2.0.0"
+    assert saved_config.created_by == "user2"
+
+
+def test_config_on_disk_is_valid_json(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests the config written by update_config is the model's JSON dump."""
+    updated_config = fmu_dir.update_config({"version": "2.0.0", "created_by": "user2"})
+
+    with open(fmu_dir.config.path, encoding="utf-8") as f:
         saved_config = json.load(f)
 
-    assert saved_config["version"] == "2.0.0"
-    assert saved_config["created_by"] == "user2"
+    assert saved_config == updated_config.model_dump(mode="json", by_alias=True)
 
 
 def test_update_config_invalid_data(fmu_dir: ProjectFMUDirectory) -> None:
@@ -384,10 +445,19 @@ def test_update_config_invalid_data(fmu_dir: ProjectFMUDirectory) -> None:
         fmu_dir.update_config(updates)
 
 
-def test_get_file_path(fmu_dir: ProjectFMUDirectory) -> None:
+def test_get_file_path(fmu_dir_ro: ProjectFMUDirectory) -> None:
     """Tests get_file_path returns correct path."""
-    path = fmu_dir.get_file_path("test.txt")
-    assert path == fmu_dir.path / "test.txt"
+    path = fmu_dir_ro.get_file_path("test.txt")
+    assert path == fmu_dir_ro.path / "test.txt"
+    assert fmu_dir_ro.get_file_path("test.txt") is path
+    assert fmu_dir_ro.get_file_path(Path("test.txt")) == path
+
+
+def test_get_file_path_cache_is_bounded(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests get_file_path does not grow its path cache without bound."""
+    for i in range(200):
+        assert fmu_dir.get_file_path(f"file_{i}.txt") == fmu_dir.path / f"file_{i}.txt"
+    assert len(fmu_dir._file_paths) <= _FILE_PATH_CACHE_SIZE
 
 
 def test_file_exists(fmu_dir: ProjectFMUDirectory) -> None:
@@ -425,6 +495,15 @@ def test_read_text_file(fmu_dir: ProjectFMUDirectory) -> None:
     assert text == test_text
 
 
+def test_read_text_file_translates_newlines(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests read_text_file translates newlines like a text mode read."""
+    test_file = fmu_dir.path / "crlf.txt"
+    test_file.write_bytes(b"one\r\ntwo\rthree\n")
+
+    assert fmu_dir.read_text_file("crlf.txt") == "one\ntwo\nthree\n"
+    assert fmu_dir.read_file("crlf.txt") == b"one\r\ntwo\rthree\n"
+
+
 def test_write_text_file(fmu_dir: ProjectFMUDirectory) -> None:
     """Tests write_text_file writes text correctly."""
     test_text = "new text data æ"
@@ -448,6 +527,53 @@ def test_write_file_creates_dir(fmu_dir: ProjectFMUDirectory) -> None:
     assert file_path.read_bytes() == test_data
 
 
+def test_write_text_file_replaces_existing_file(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests overwriting a file leaves no temporary file behind."""
+    fmu_dir.write_text_file("replaced.txt", "old")
+    fmu_dir.write_text_file("replaced.txt", "new")
+
+    assert fmu_dir.read_text_file("replaced.txt") == "new"
+    assert not list(fmu_dir.path.glob("replaced.txt.tmp.*"))
+
+
+def test_write_file_keeps_permissions_and_symlinks(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests overwriting a file keeps its mode and writes through symlinks."""
+    private_file = fmu_dir.path / "private.json"
+    private_file.write_text("old")
+    private_file.chmod(0o600)
+    fmu_dir.write_text_file("private.json", "new")
+
+    assert private_file.read_text() == "new"
+    assert stat.S_IMODE(private_file.stat().st_mode) == 0o600  # noqa: PLR2004
+
+    link = fmu_dir.path / "link.json"
+    link.symlink_to(private_file)
+    fmu_dir.write_text_file("link.json", "via link")
+
+    assert link.is_symlink()
+    assert private_file.read_text() == "via link"
+
+
+def test_write_file_keeps_old_contents_on_failure(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests a failed write leaves the existing file untouched."""
+    fmu_dir.write_file("kept.bin", b"old")
+
+    with (
+        patch("os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        fmu_dir.write_file("kept.bin", b"new")
+
+    assert fmu_dir.read_file("kept.bin") == b"old"
+    assert not list(fmu_dir.path.glob("kept.bin.tmp.*"))
+
+
 def test_write_operations_raise_when_locked(
     fmu_dir: ProjectFMUDirectory,
 ) -> None:
@@ -516,6 +642,21 @@ def test_resolve_path_inside_project_returns_resolved_path(
     assert resolved_path == fmu_dir.base_path / "data/custom/file.txt"
 
 
+def test_base_path_is_resolved_when_opened_through_symlink(
+    fmu_dir: ProjectFMUDirectory, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Opening through a symlink yields the canonical base path."""
+    link = tmp_path_factory.mktemp("links") / "project"
+    link.symlink_to(fmu_dir.base_path, target_is_directory=True)
+
+    linked_fmu_dir = get_fmu_directory(link)
+
+    assert linked_fmu_dir.base_path == fmu_dir.base_path
+    assert linked_fmu_dir.resolve_path_inside_project(link / "file.txt") == (
+        fmu_dir.base_path / "file.txt"
+    )
+
+
 @pytest.mark.parametrize("path", [Path("../outside.txt"), Path("/tmp/outside.txt")])
 def test_resolve_path_inside_project_raises_for_paths_outside_project_root(
     fmu_dir: ProjectFMUDirectory,
@@ -785,6 +926,7 @@ def test_restore_resets_when_cache_missing_and_logs_restore(
     assert readme_path.exists()
     assert readme_path.read_text() == PROJECT_README_CONTENT
     assert (fmu_dir.config.path).exists()
+    assert (fmu_dir.path / "cache" / "CACHEDIR.TAG").is_file()
     changelog = fmu_dir.changelog.load()
     assert len(changelog) == 1
     assert changelog[0].change_type == ChangeType.restore
@@ -23,22 +23,28 @@ from fmu.settings.models.project_config import ProjectConfig
 from fmu.settings.models.user_config import UserConfig
 
 
-def test_create_fmu_directory(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("setup", "error", "match"),
+    [
+        (None, FileNotFoundError, "Base path '/foo' does not exist."),
+        ("mkdir", FileExistsError, "{fmu_dir} already exists"),
+        ("touch", FileExistsError, "{fmu_dir} exists but is not a directory"),
+    ],
+)
+def test_create_fmu_directory(
+    tmp_path: Path, setup: str | None, error: type[Exception], match: str
+) -> None:
     """Tests creating the .fmu directory raises appropriate exceptions."""
-    with pytest.raises(FileNotFoundError, match="Base path '/foo' does not exist."):
-        _create_fmu_directory(Path("/foo"))
-
     fmu_dir = tmp_path / ".fmu"
-    fmu_dir.mkdir()
-    with pytest.raises(FileExistsError, match=f"{fmu_dir} already exists"):
-        _create_fmu_directory(tmp_path)
-
-    fmu_dir.rmdir()
-    fmu_dir.touch()
-    with pytest.raises(
-        FileExistsError, match=f"{fmu_dir} exists but is not a directory"
-    ):
-        _create_fmu_directory(tmp_path)
+    if setup is None:
+        base_path = Path("/foo")
+    else:
+        # Create .fmu as a directory or a file with the matching Path method
+        getattr(fmu_dir, setup)()
+        base_path = tmp_path
+
+    with pytest.raises(error, match=match.format(fmu_dir=fmu_dir)):
+        _create_fmu_directory(base_path)
 
 
 def test_init_fmu_directory_with_no_config_data(
@@ -48,7 +54,7 @@ def test_init_fmu_directory_with_no_config_data(
     """Tests initializing a .fmu directory with default settings."""
     with (
         patch(
-            "fmu.settings.models.project_config.getpass.getuser",
+            "fmu.settings.models.project_config.current_user",
             return_value="user",
         ),
     ):
@@ -74,25 +80,24 @@ def test_init_fmu_directory_with_no_config_data(
     assert one_min_ago <= created_at <= now
 
 
-def test_create_fmu_directory_with_config_model(
-    fmu_project_root: Path,
-    config_model: ProjectConfig,
-) -> None:
-    """Tests initializing a .fmu directory with a ProjectConfig model."""
-    config_model.version = "200.0.0"
-    config_model.model_rebuild()
-    fmu_dir = init_fmu_directory(fmu_project_root, config_model)
-    config = fmu_dir.config.load()
-    assert config.version == "200.0.0"
+@pytest.fixture
+def config_data(
+    request: pytest.FixtureRequest, config_dict: dict[str, Any]
+) -> dict[str, Any] | ProjectConfig:
+    """Config data with version 200.0.0, as a dict or as a ProjectConfig model."""
+    config_dict["version"] = "200.0.0"
+    if request.param == "model":
+        return ProjectConfig.model_validate(config_dict)
+    return config_dict
 
 
-def test_create_fmu_directory_with_config_dict(
+@pytest.mark.parametrize("config_data", ["dict", "model"], indirect=True)
+def test_create_fmu_directory_with_config_data(
     fmu_project_root: Path,
-    config_dict: dict[str, Any],
+    config_data: dict[str, Any] | ProjectConfig,
 ) -> None:
-    """Tests initializing a .fmu directory with a ProjectConfig model."""
-    config_dict["version"] = "200.0.0"
-    fmu_dir = init_fmu_directory(fmu_project_root, config_dict)
+    """Tests initializing a .fmu directory with a config dict or ProjectConfig."""
+    fmu_dir = init_fmu_directory(fmu_project_root, config_data)
     config = fmu_dir.config.load()
     assert config.version == "200.0.0"
 
@@ -251,7 +256,7 @@ def test_write_user_fmu_config_roundtrip(tmp_path: Path) -> None:
     UserConfig.model_validate(config_data)
 
 
-def test_user_readme_is_written(tmp_path: Path, config_model: ProjectConfig) -> None:
+def test_user_readme_is_written(tmp_path: Path) -> None:
     """Tests that the README is written when .fmu is initialized."""
     with patch("pathlib.Path.home", return_value=tmp_path):
         fmu_dir = init_user_fmu_directory()
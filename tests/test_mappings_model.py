@@ -427,134 +427,94 @@ def test_internal_stratigraphy_mappings_validates_collection(
     validate_collection.assert_called_once_with([mapping])
 
 
-def test_validate_identifier_mappings_collection_rejects_alias_without_primary() -> (
-    None
-):
-    """Same-system aliases must point to an existing same-system primary."""
-    alias = create_stratigraphy_mapping(
-        relation_type=InternalRelationType.alias,
-        source_id="TOP_VOLANTIS",
-        target_id="TopVolantis",
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=(
+@pytest.mark.parametrize(
+    ("mappings", "match"),
+    [
+        # A same-system alias without its primary
+        (
+            [
+                create_stratigraphy_mapping(
+                    relation_type=InternalRelationType.alias,
+                    source_id="TOP_VOLANTIS",
+                    target_id="TopVolantis",
+                ),
+            ],
             "Same-system alias mappings must point to an existing "
-            "same-system primary source_id"
+            "same-system primary source_id",
         ),
-    ):
-        mappings_model._validate_identifier_mappings_collection([alias])
-
-
-def test_validate_collection_rejects_cross_system_alias_sources() -> None:
-    """Cross-system mappings must use same-system primary source identifiers."""
-    primary = create_stratigraphy_mapping()
-    alias = create_stratigraphy_mapping(
-        relation_type=InternalRelationType.alias,
-        source_id="TOP_VOLANTIS",
-        target_id="TopVolantis",
-    )
-    mapped_alias = create_stratigraphy_mapping(
-        source_system=DataSystem.rms,
-        target_system=DataSystem.smda,
-        relation_type=InternalRelationType.primary,
-        source_id="TOP_VOLANTIS",
-        target_id="VOLANTIS GP. Top",
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=(
+        # A cross-system mapping from an alias source
+        (
+            [
+                create_stratigraphy_mapping(),
+                create_stratigraphy_mapping(
+                    relation_type=InternalRelationType.alias,
+                    source_id="TOP_VOLANTIS",
+                    target_id="TopVolantis",
+                ),
+                create_stratigraphy_mapping(
+                    target_system=DataSystem.smda,
+                    source_id="TOP_VOLANTIS",
+                    target_id="VOLANTIS GP. Top",
+                ),
+            ],
             "Cross-system mappings must use a source_id that is defined "
-            "as a same-system primary"
+            "as a same-system primary",
         ),
-    ):
-        mappings_model._validate_identifier_mappings_collection(
-            [primary, alias, mapped_alias]
-        )
-
-
-def test_validate_collection_rejects_multiple_cross_system_outcomes() -> None:
-    """A same-system primary identifier can only have one outcome per target system."""
-    primary = create_stratigraphy_mapping()
-    mapped = create_stratigraphy_mapping(
-        source_system=DataSystem.rms,
-        target_system=DataSystem.smda,
-        relation_type=InternalRelationType.primary,
-        source_id="TopVolantis",
-        target_id="VOLANTIS GP. Top",
-    )
-    unmappable = create_stratigraphy_mapping(
-        source_system=DataSystem.rms,
-        target_system=DataSystem.smda,
-        relation_type=InternalRelationType.unmappable,
-        source_id="TopVolantis",
-        target_id=None,
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=("A source_id can only have one cross-system mapping per target system"),
-    ):
-        mappings_model._validate_identifier_mappings_collection(
-            [primary, mapped, unmappable]
-        )
-
-
-def test_validate_collection_rejects_reused_cross_system_target_id() -> None:
-    """A cross-system target identifier can only belong to one primary source."""
-    first_primary = create_stratigraphy_mapping()
-    second_primary = create_stratigraphy_mapping(
-        source_id="Volon",
-        target_id="Volon",
-    )
-    first_mapping = create_stratigraphy_mapping(
-        source_system=DataSystem.rms,
-        target_system=DataSystem.smda,
-        relation_type=InternalRelationType.primary,
-        source_id="TopVolantis",
-        target_id="VOLANTIS GP. Top",
-    )
-    second_mapping = create_stratigraphy_mapping(
-        source_system=DataSystem.rms,
-        target_system=DataSystem.smda,
-        relation_type=InternalRelationType.primary,
-        source_id="Volon",
-        target_id="VOLANTIS GP. Top",
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=(
-            "A target_id can only be used by one cross-system mapping per target system"
+        # Two outcomes for one primary and target system
+        (
+            [
+                create_stratigraphy_mapping(),
+                create_stratigraphy_mapping(
+                    target_system=DataSystem.smda,
+                    target_id="VOLANTIS GP. Top",
+                ),
+                create_stratigraphy_mapping(
+                    target_system=DataSystem.smda,
+                    relation_type=InternalRelationType.unmappable,
+                    target_id=None,
+                ),
+            ],
+            "A source_id can only have one cross-system mapping per target system",
         ),
-    ):
-        mappings_model._validate_identifier_mappings_collection(
-            [first_primary, second_primary, first_mapping, second_mapping]
-        )
-
-
-def test_validate_collection_rejects_reused_same_system_source_id() -> None:
-    """A source_id cannot be both a primary and an alias in the same collection."""
-    primary = create_stratigraphy_mapping()
-    other_primary = create_stratigraphy_mapping(
-        source_id="TopVolon",
-        target_id="TopVolon",
-    )
-    conflicting_alias = create_stratigraphy_mapping(
-        relation_type=InternalRelationType.alias,
-        source_id="TopVolantis",
-        target_id="TopVolon",
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=("Same-system mappings cannot reuse the same source_id"),
-    ):
-        mappings_model._validate_identifier_mappings_collection(
-            [primary, other_primary, conflicting_alias]
-        )
+        # One cross-system target_id used by two primaries
+        (
+            [
+                create_stratigraphy_mapping(),
+                create_stratigraphy_mapping(source_id="Volon", target_id="Volon"),
+                create_stratigraphy_mapping(
+                    target_system=DataSystem.smda,
+                    target_id="VOLANTIS GP. Top",
+                ),
+                create_stratigraphy_mapping(
+                    target_system=DataSystem.smda,
+                    source_id="Volon",
+                    target_id="VOLANTIS GP. Top",
+                ),
+            ],
+            "A target_id can only be used by one cross-system mapping per target "
+            "system",
+        ),
+        # A source_id used as both a primary and an alias
+        (
+            [
+                create_stratigraphy_mapping(),
+                create_stratigraphy_mapping(source_id="TopVolon", target_id="TopVolon"),
+                create_stratigraphy_mapping(
+                    relation_type=InternalRelationType.alias,
+                    source_id="TopVolantis",
+                    target_id="TopVolon",
+                ),
+            ],
+            "Same-system mappings cannot reuse the same source_id",
+        ),
+    ],
+)
+def test_validate_identifier_mappings_collection_rejects_invalid_collections(
+    mappings: list[InternalIdentifierMapping], match: str
+) -> None:
+    """Collections breaking the mapping rules are rejected by the shared helper."""
+    with pytest.raises(ValueError, match=match):
+        mappings_model._validate_identifier_mappings_collection(mappings)
 
 
 def test_validate_identifier_mappings_collection_allows_multiple_target_systems() -> (
@@ -2,6 +2,7 @@
 
 import json
 import os
+import shutil
 from collections.abc import Callable
 from contextlib import AbstractContextManager
 from datetime import UTC, datetime, timedelta
@@ -10,6 +11,7 @@ from pathlib import Path
 import pytest
 
 from fmu.settings._fmu_dir import ProjectFMUDirectory
+from fmu.settings._resources import cache_manager
 from fmu.settings._resources.cache_manager import (
     _CACHEDIR_TAG_CONTENT,
     CacheManager,
@@ -84,6 +86,79 @@ def test_cache_manager_cache_root_helpers_create_tag(
     assert tag_path.read_text(encoding="utf-8") == _CACHEDIR_TAG_CONTENT
 
 
+def test_cache_manager_checks_cachedir_tag_once_while_cache_exists(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """The cachedir tag is checked once per manager while the cache root exists."""
+    manager = CacheManager(fmu_dir)
+    manager.store_revision("foo.json", "one")
+    tag_path = fmu_dir.path / "cache" / "CACHEDIR.TAG"
+    tag_path.unlink()
+
+    manager.store_revision("foo.json", "two")
+    assert not tag_path.exists()
+
+
+def test_cache_manager_recreates_cachedir_tag_after_cache_removal(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """A cache directory deleted outside the manager gets its tag back."""
+    manager = CacheManager(fmu_dir)
+    manager.store_revision("foo.json", "one")
+    cache_root = fmu_dir.path / "cache"
+    shutil.rmtree(cache_root)
+
+    manager.store_revision("foo.json", "two")
+
+    tag_path = cache_root / "CACHEDIR.TAG"
+    assert tag_path.read_text(encoding="utf-8") == _CACHEDIR_TAG_CONTENT
+    assert len(manager.list_revisions("foo.json")) == 1
+
+
+def test_cache_manager_sees_revisions_from_other_writers(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Snapshots added or removed by someone else are counted and trimmed."""
+    manager = CacheManager(fmu_dir)
+    other_manager = CacheManager(fmu_dir)
+    manager.store_revision("foo.json", "first")
+    config_cache = fmu_dir.path / "cache" / "foo"
+
+    external = config_cache / "99991231T235959.999999Z-ffffffff.json"
+    external.write_text("external", encoding="utf-8")
+    revisions = manager.list_revisions("foo.json")
+    assert revisions[-1] == external
+    assert len(revisions) == 2  # noqa: PLR2004
+
+    external.unlink()
+    assert len(manager.list_revisions("foo.json")) == 1
+
+    for i in range(CacheManager.MIN_REVISIONS):
+        other_manager.store_revision("foo.json", f"other_{i}")
+    manager.store_revision("foo.json", "last")
+    assert len(_read_snapshot_names(config_cache)) == CacheManager.MIN_REVISIONS
+
+
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_cache_manager_writes_snapshots_without_leftovers(
+    fmu_dir: ProjectFMUDirectory,
+    monkeypatch: pytest.MonkeyPatch,
+    use_tmpfile: bool,
+) -> None:
+    """Snapshots are written whole with and without O_TMPFILE support."""
+    if not use_tmpfile:
+        monkeypatch.setattr(cache_manager, "_O_TMPFILE", None)
+    manager = CacheManager(fmu_dir)
+
+    snapshot = manager.store_revision("foo.json", '{"foo": "bar"}')
+
+    assert snapshot is not None
+    assert snapshot.read_text(encoding="utf-8") == '{"foo": "bar"}'
+    cache_root = fmu_dir.path / "cache"
+    assert not [p for p in cache_root.iterdir() if p.name.endswith(".tmp")]
+    assert manager.list_revisions("foo.json") == [snapshot]
+
+
 def test_cache_manager_uses_default_extension_for_suffixless_paths(
     fmu_dir: ProjectFMUDirectory,
 ) -> None:
@@ -95,6 +170,25 @@ def test_cache_manager_uses_default_extension_for_suffixless_paths(
     assert snapshot.read_text(encoding="utf-8") == "payload"
 
 
+def test_cache_manager_snapshot_filename_layout(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Snapshot names are a strftime-style UTC timestamp, a token and the suffix."""
+    manager = CacheManager(fmu_dir)
+    before = datetime.now(UTC).replace(microsecond=0)
+    name = manager._snapshot_filename(Path("config.json"))
+    after = datetime.now(UTC)
+
+    timestamp, token_and_suffix = name.split("-")
+    parsed = datetime.strptime(timestamp, "%Y%m%dT%H%M%S.%fZ").replace(tzinfo=UTC)
+    assert before <= parsed <= after
+    assert parsed.strftime("%Y%m%dT%H%M%S.%fZ") == timestamp
+    token, suffix = token_and_suffix.split(".")
+    assert len(token) == 8  # noqa: PLR2004
+    int(token, 16)
+    assert suffix == "json"
+
+
 def test_cache_manager_trim_handles_missing_files(
     fmu_dir: ProjectFMUDirectory,
     monkeypatch: pytest.MonkeyPatch,
@@ -104,16 +198,16 @@ def test_cache_manager_trim_handles_missing_files(
     for i in range(CacheManager.MIN_REVISIONS + 2):
         manager.store_revision("foo.json", f"content_{i}")
 
-    original_unlink = Path.unlink
+    original_unlink = os.unlink
 
-    def flaky_unlink(self: Path, *, missing_ok: bool = False) -> None:
-        if self.name.endswith(".json") and not getattr(flaky_unlink, "raised", False):
+    def flaky_unlink(path: str) -> None:
+        if path.endswith(".json") and not getattr(flaky_unlink, "raised", False):
             flaky_unlink.raised = True  # type: ignore[attr-defined]
-            original_unlink(self, missing_ok=missing_ok)
+            original_unlink(path)
             raise FileNotFoundError
-        original_unlink(self, missing_ok=missing_ok)
+        original_unlink(path)
 
-    monkeypatch.setattr(Path, "unlink", flaky_unlink)
+    monkeypatch.setattr(os, "unlink", flaky_unlink)
 
     manager.store_revision("foo.json", "final")
 
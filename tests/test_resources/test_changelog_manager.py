@@ -6,6 +6,7 @@ import warnings
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -148,6 +149,40 @@ def test_changelog_manager_add_invalid_entry(
     assert changelog[0] == change_entry
 
 
+def test_changelog_manager_add_log_entries_saves_once(
+    fmu_dir: ProjectFMUDirectory, change_entry: ChangeInfo
+) -> None:
+    """Tests adding several entries writes the changelog a single time."""
+    changelog_resource: ChangelogManager = ChangelogManager(fmu_dir)
+    expected_log_entries = 3
+
+    with patch.object(
+        changelog_resource, "save", wraps=changelog_resource.save
+    ) as mock_save:
+        changelog_resource.add_log_entries([change_entry] * expected_log_entries)
+
+    mock_save.assert_called_once()
+    assert len(changelog_resource.load(force=True)) == expected_log_entries
+
+
+def test_changelog_manager_add_log_entries_with_invalid_entry(
+    fmu_dir: ProjectFMUDirectory, change_entry: ChangeInfo
+) -> None:
+    """Tests no entries are added when one of several entries is invalid."""
+    changelog_resource: ChangelogManager = ChangelogManager(fmu_dir)
+    changelog_resource.add_log_entry(change_entry)
+
+    change_entry_with_issues = copy.deepcopy(change_entry)
+    del change_entry_with_issues.change_type
+
+    with pytest.raises(
+        ValueError, match=r"Invalid log entry added to 'Log\[ChangeInfo\]' "
+    ):
+        changelog_resource.add_log_entries([change_entry, change_entry_with_issues])
+
+    assert len(changelog_resource.load(force=True)) == 1
+
+
 def test_changelog_manager_add_invalid_entry_no_file_created(
     fmu_dir: ProjectFMUDirectory, change_entry: ChangeInfo
 ) -> None:
@@ -659,6 +659,19 @@ def test_ensure_can_write_owned_lock(fmu_dir: ProjectFMUDirectory) -> None:
     lock.release()
 
 
+def test_ensure_can_write_owned_lock_reads_lock_once(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests ensure_can_write reads the lock file once when the lock is owned."""
+    lock = LockManager(fmu_dir)
+    lock.acquire()
+    with patch.object(lock, "load", wraps=lock.load) as mock_load:
+        lock.ensure_can_write()
+    forced_loads = [c for c in mock_load.call_args_list if c.kwargs.get("force")]
+    assert len(forced_loads) == 1
+    lock.release()
+
+
 def test_ensure_can_write_stale_lock(fmu_dir: ProjectFMUDirectory) -> None:
     """Tests ensure_can_write ignores stale locks."""
     lock = LockManager(fmu_dir)
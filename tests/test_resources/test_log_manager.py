@@ -1,5 +1,7 @@
 """Tests for LogManager."""
 
+import subprocess
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Self
@@ -220,3 +222,13 @@ def test_filtering_with_incompatible_filter_type_raises_value_error(
                 operator=">",
             )
         )
+
+
+def test_importing_fmu_settings_does_not_import_pandas() -> None:
+    """Tests that pandas is only imported once a log is filtered."""
+    code = (
+        "import sys, fmu.settings._fmu_dir, fmu.settings._init; "
+        "sys.exit('pandas' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+    assert result.returncode == 0
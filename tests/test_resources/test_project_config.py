@@ -16,12 +16,14 @@ from fmu.datamodels.common.masterdata import (
     StratigraphicColumn,
 )
 from fmu.datamodels.fmu_results.fields import Model
+from pydantic import ValidationError
 
 from fmu.settings._fmu_dir import ProjectFMUDirectory, UserFMUDirectory
 from fmu.settings._resources.config_managers import (
     ProjectConfigManager,
     UserConfigManager,
 )
+from fmu.settings._utils import current_user
 from fmu.settings.models._enums import ChangeType
 from fmu.settings.models.diff import ListFieldDiff
 from fmu.settings.models.project_config import (
@@ -142,6 +144,31 @@ def test_get_key(fmu_dir: ProjectFMUDirectory) -> None:
     assert fmu_dir.config.get("notreal", "foo") == "foo"
 
 
+@pytest.mark.parametrize(
+    "key",
+    [
+        "masterdata.smda",
+        "masterdata.smda.country",
+        "model.name",
+        "access.asset.name",
+        "rms.path",
+        "rms.zones",
+        "rms.coordinate_system.name",
+        "validation.rms_project",
+        "created_by.name",
+        "masterdata.not_real",
+        "model.name.not_real",
+    ],
+)
+def test_get_dot_notation_key_matches_model_dump(
+    drogon_fmu_dir: ProjectFMUDirectory, key: str
+) -> None:
+    """Tests dotted gets return the same value as a lookup in the dumped config."""
+    config = drogon_fmu_dir.config
+    expected = config._get_dot_notation_key(config.load().model_dump(), key, "foo")
+    assert config.get(key, "foo") == expected
+
+
 def test_get_key_config_does_not_exist(tmp_path: Path) -> None:
     """Tests getting a key when the config is missing."""
     empty_fmu_dir = tmp_path / ".fmu"
@@ -215,6 +242,30 @@ def test_set_key(fmu_dir: ProjectFMUDirectory) -> None:
         fmu_dir.config.set("version", 2.0)
 
 
+def test_set_unknown_key_skips_write(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests that keys dropped by validation do not rewrite the config."""
+    with patch.object(ProjectConfigManager, "save") as save:
+        fmu_dir.config.set("does.not.exist", "foo")
+        fmu_dir.config.update({"notreal": "foo"})
+        save.assert_not_called()
+
+        fmu_dir.config.set("created_by", fmu_dir.config.get("created_by"))
+        save.assert_called_once()
+
+
+def test_set_unknown_key_skips_changelog(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests that skipped config writes add no changelog entries."""
+    fmu_dir.config.set("created_by", "user2")
+    changelog_path = fmu_dir._changelog.path
+    changelog_before = changelog_path.read_text()
+
+    fmu_dir.config.set("does.not.exist", "foo")
+    fmu_dir.config.update({"notreal": "foo"})
+
+    assert changelog_path.read_text() == changelog_before
+    assert len(fmu_dir._changelog.load(force=True)) == 1
+
+
 def test_set_key_config_does_not_exist(tmp_path: Path) -> None:
     """Tests getting a key when the config is missing."""
     empty_fmu_dir = tmp_path / ".fmu"
@@ -249,6 +300,80 @@ def test_update_config(fmu_dir: ProjectFMUDirectory) -> None:
         fmu_dir.config.update(bad_updates)
 
 
+def test_update_config_validates_once(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests that update validates the config once, however many keys change."""
+    updates = {
+        "created_by": "user2",
+        "version": "200.0.0",
+        "cache_max_revisions": 10,
+        "not.real": 0,
+    }
+    config = fmu_dir.config.load()
+    with patch.object(
+        ProjectConfig, "model_validate", wraps=ProjectConfig.model_validate
+    ) as model_validate:
+        fmu_dir.config._apply_updates(config, updates)
+
+    model_validate.assert_called_once()
+
+
+def test_update_config_validates_only_updated_fields(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests that updates to known fields skip validating the whole config."""
+    updates = {"created_by": "user2", "validation.rms_project": None}
+    config = fmu_dir.config.load()
+    with patch.object(
+        ProjectConfig, "model_validate", wraps=ProjectConfig.model_validate
+    ) as model_validate:
+        fmu_dir.config._apply_updates(config, updates)
+        fmu_dir.config._apply_updates(config, {"cache_max_revisions": 10})
+
+    model_validate.assert_not_called()
+    fmu_dir.config.update(updates)
+    fmu_dir.config.set("cache_max_revisions", 10)
+    config = fmu_dir.config.load(force=True)
+    assert config.created_by == "user2"
+    assert config.cache_max_revisions == 10  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="greater than or equal to 5"):
+        fmu_dir.config.set("cache_max_revisions", 1)
+    with pytest.raises(ValueError, match="model.revision"):
+        fmu_dir.config.update({"model.name": "Drogon"})
+
+
+def test_update_config_rejects_invalid_updates_without_writing(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests that an invalid update leaves the config file and cache untouched."""
+    config_path = fmu_dir.path / "config.json"
+    content_before = config_path.read_text()
+
+    with (
+        patch.object(ProjectConfigManager, "save") as save,
+        pytest.raises(ValueError, match="Invalid value set"),
+    ):
+        fmu_dir.config.update({"created_by": "user2", "version": "major"})
+
+    save.assert_not_called()
+    assert config_path.read_text() == content_before
+    assert fmu_dir.config.get("created_by") != "user2"
+
+
+def test_save_config_validates_model(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests that saving an invalid config raises instead of writing it."""
+    config = fmu_dir.config.load()
+    invalid_config = ProjectConfig.model_construct(
+        **{**dict(config), "cache_max_revisions": 1}
+    )
+    content_before = fmu_dir.read_text_file("config.json")
+
+    with pytest.raises(ValidationError, match="cache_max_revisions"):
+        fmu_dir.config.save(invalid_config)
+
+    assert fmu_dir.read_text_file("config.json") == content_before
+
+
 def test_update_config_writes_to_changelog(fmu_dir: ProjectFMUDirectory) -> None:
     """Tests that config updates are written to changelog."""
     fmu_dir.config.update({"created_by": "user2", "version": "200.0.0", "new.field": 0})
@@ -414,6 +539,9 @@ def test_save(fmu_dir: ProjectFMUDirectory, config_dict: dict[str, Any]) -> None
 
     assert fmu_dir.config._cache is not None
     assert fmu_dir.config._cache.created_by == new_config.created_by
+    # The saved copy is stamped, the model passed in is left untouched
+    assert fmu_dir.config._cache is not new_config
+    assert new_config.last_modified_at == config_dict["last_modified_at"]
     with open(fmu_dir.config.path, encoding="utf-8") as f:
         new_config_dict = json.loads(f.read())
 
@@ -433,6 +561,23 @@ def test_save(fmu_dir: ProjectFMUDirectory, config_dict: dict[str, Any]) -> None
     assert config_dict == new_config_dict
 
 
+def test_save_looks_up_current_user_once(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests that repeated saves reuse the cached user name."""
+    current_user.cache_clear()
+    try:
+        with patch(
+            "fmu.settings._utils.getpass.getuser", return_value="someone"
+        ) as getuser:
+            config = fmu_dir.config.load()
+            fmu_dir.config.save(config)
+            fmu_dir.config.save(config)
+    finally:
+        current_user.cache_clear()
+
+    getuser.assert_called_once()
+    assert fmu_dir.config.load().last_modified_by == "someone"
+
+
 def test_project_config_diff_with_other_config(
     fmu_dir: ProjectFMUDirectory,
     extra_fmu_dir: ProjectFMUDirectory,
@@ -639,7 +784,7 @@ def test_project_config_merge_with_other_config(
 def test_project_config_reset_has_none_last_modified_fields() -> None:
     """Tests that reset() creates a config with None for last_modified fields."""
     with patch(
-        "fmu.settings.models.project_config.getpass.getuser",
+        "fmu.settings.models.project_config.current_user",
         return_value="test_user",
     ):
         config = ProjectConfig.reset()
@@ -6,11 +6,11 @@ from collections.abc import Callable
 from contextlib import AbstractContextManager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Self
+from typing import Any, Self
 from unittest.mock import patch
 
 import pytest
-from pydantic import AwareDatetime, BaseModel
+from pydantic import AwareDatetime, BaseModel, TypeAdapter, ValidationError
 
 from fmu.settings._fmu_dir import ProjectFMUDirectory
 from fmu.settings._resources.lock_manager import LockManager
@@ -18,7 +18,7 @@ from fmu.settings._resources.pydantic_resource_manager import (
     MutablePydanticResourceManager,
     PydanticResourceManager,
 )
-from fmu.settings.models.diff import ListFieldDiff, ScalarFieldDiff
+from fmu.settings.models.diff import ListFieldDiff, ResourceDiff, ScalarFieldDiff
 from fmu.settings.types import ResettableBaseModel
 
 
@@ -143,6 +143,28 @@ def test_pydantic_resource_manager_load(fmu_dir: ProjectFMUDirectory) -> None:
     assert test_manager._cache == test_resource
 
 
+def test_dot_notation_key_helpers_walk_nested_dicts(
+    fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests dot-notation get/set on nested and non-dict intermediate values."""
+    data: dict[str, Any] = {"a": {"b": 1}, "c": None, "d": [1, 2], "e": "str"}
+
+    get = PydanticResourceManager._get_dot_notation_key
+    assert get(data, "a.b") == 1
+    assert get(data, "a.x", "default") == "default"
+    assert get(data, "c.b", "default") == "default"
+    assert get(data, "d.0", "default") == "default"
+    assert get(data, "e.b", "default") == "default"
+
+    set_ = fmu_dir.config._set_dot_notation_key
+    set_(data, "a.b", 2)
+    set_(data, "c.b", 3)
+    set_(data, "x.y.z", 4)
+    assert data["a"] == {"b": 2}
+    assert data["c"] == {"b": 3}
+    assert data["x"] == {"y": {"z": 4}}
+
+
 def test_pydantic_resource_manager_load_permission_error(
     fmu_dir: ProjectFMUDirectory,
     no_permissions: Callable[[str | Path], AbstractContextManager[None]],
@@ -211,6 +233,25 @@ def test_pydantic_resource_manager_load_force_true_cache_false(
     assert test_manager._cache is test_resource
 
 
+def test_pydantic_resource_manager_force_load_ignores_nested_mutations(
+    drogon_fmu_dir: ProjectFMUDirectory,
+) -> None:
+    """Tests a forced load reflects the file, not mutated models handed out."""
+    config = drogon_fmu_dir.config
+    loaded = config.load(force=True)
+    assert loaded.model is not None
+    loaded.model.name = "MUTATED"
+    reloaded = config.load(force=True)
+    assert reloaded.model is not None
+    assert reloaded.model.name == "Drogon"
+
+    config.save(reloaded)
+    reloaded.model.name = "MUTATED"
+    after_save = config.load(force=True)
+    assert after_save.model is not None
+    assert after_save.model.name == "Drogon"
+
+
 def test_pydantic_resource_manager_loads_invalid_model(
     fmu_dir: ProjectFMUDirectory,
 ) -> None:
@@ -400,6 +441,8 @@ def test_pydantic_resource_manager_get_structured_model_diff_scalar(
     assert diff.field_path == "foo"
     assert diff.before == "current_value"
     assert diff.after == "incoming_value"
+    with pytest.raises(ValidationError, match="frozen"):
+        diff.after = "other"
 
 
 def test_pydantic_resource_manager_get_model_diff_raises_when_different_type(
@@ -572,6 +615,36 @@ def test_pydantic_resource_manager_get_structured_model_diff_when_list_diff_with
     assert diff.updated[0].key == "A"
     assert diff.updated[0].before["value"] == "1"
     assert diff.updated[0].after["value"] == "2"
+    assert ListFieldDiff.model_validate(diff.model_dump()) == diff
+
+
+def test_resource_diff_validates_by_diff_kind(fmu_dir: ProjectFMUDirectory) -> None:
+    """Tests dumped structured diffs validate back to their own diff model."""
+
+    class ExampleListItem(BaseModel):
+        name: str
+
+    class ExamplePydanticModel(BaseModel):
+        foo: str
+        items: list[ExampleListItem]
+
+    class PydanticManagerListKeyTest(PydanticManagerTest):
+        @property
+        def diff_list_keys(self: Self) -> dict[str, str]:
+            return {"items": "name"}
+
+    test_manager = PydanticManagerListKeyTest(fmu_dir)
+    model_diff = test_manager.get_structured_model_diff(
+        ExamplePydanticModel(foo="a", items=[]),
+        ExamplePydanticModel(foo="b", items=[ExampleListItem(name="A")]),
+    )
+    adapter = TypeAdapter(list[ResourceDiff])
+
+    validated = adapter.validate_json(adapter.dump_json(model_diff))
+
+    assert [type(diff) for diff in validated] == [ScalarFieldDiff, ListFieldDiff]
+    assert validated == model_diff
+    assert all(isinstance(diff, ResourceDiff) for diff in validated)
 
 
 def test_pydantic_resource_manager_get_diff_when_value_is_none(